@@ -7,6 +7,8 @@ from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, field
 import random
 
+from compat import DATACLASS_OPTIONS
+
 
 class PersonalityTrait(Enum):
     """性格特征枚举"""
@@ -33,7 +35,7 @@ class PlayStyle(Enum):
     COMBO_ORIENTED = "combo"         # 连锁型
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class PersonalityProfile:
     """人格配置档案"""
     name: str
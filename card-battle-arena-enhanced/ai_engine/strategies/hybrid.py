@@ -112,7 +112,7 @@ class HybridAIStrategy(AIStrategy):
                 llm_config = self.config.get("llm_config", {})
                 strategy = LLMEnhancedStrategy(f"{self.name}_LLM层", llm_config)
             else:
-                logger.warning(f"未知策略类型: {strategy_name}")
+                logger.warning("未知策略类型: %s", strategy_name)
                 continue
 
             self.sub_strategies[strategy_name] = strategy
@@ -120,7 +120,7 @@ class HybridAIStrategy(AIStrategy):
             self.strategy_performance[strategy_name] = []
             self.strategy_usage_count[strategy_name] = 0
 
-            logger.info(f"初始化子策略: {strategy_name}, 权重: {weight}")
+            logger.info("初始化子策略: %s, 权重: %s", strategy_name, weight)
 
     def register_sub_strategy(self, name: str, strategy: AIStrategy, weight: float = 1.0):
         """注册子策略"""
@@ -128,7 +128,7 @@ class HybridAIStrategy(AIStrategy):
         self.strategy_weights[name] = weight
         self.strategy_performance[name] = []
         self.strategy_usage_count[name] = 0
-        logger.info(f"注册子策略: {name}, 权重: {weight}")
+        logger.info("注册子策略: %s, 权重: %s", name, weight)
 
     def set_llm_manager(self, llm_manager):
         """设置LLM管理器"""
@@ -153,9 +153,10 @@ class HybridAIStrategy(AIStrategy):
                 return await self._fallback_decision(context)
 
             # 显示收集到的决策
-            logger.info(f"✅ 收集到 {len(strategy_decisions)} 个策略决策:")
-            for strategy_name, action in strategy_decisions:
-                logger.info(f"   - {strategy_name}: {action.action_type.value} (置信度: {action.confidence:.2f})")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ 收集到 %d 个策略决策:", len(strategy_decisions))
+                for strategy_name, action in strategy_decisions:
+                    logger.info("   - %s: %s (置信度: %.2f)", strategy_name, action.action_type.value, action.confidence)
 
             # 生成混合决策
             logger.info("🔄 步骤2: 生成混合决策...")
@@ -164,7 +165,7 @@ class HybridAIStrategy(AIStrategy):
             # 验证决策质量
             logger.info("✔️ 步骤3: 验证决策质量...")
             if not self._validate_decision(hybrid_decision):
-                logger.warning(f"❌ 混合决策未通过验证 (共识分数: {hybrid_decision.consensus_score:.2f})，使用回退策略")
+                logger.warning("❌ 混合决策未通过验证 (共识分数: %.2f)，使用回退策略", hybrid_decision.consensus_score)
                 return await self._fallback_decision(context)
 
             # 更新性能统计
@@ -177,19 +178,20 @@ class HybridAIStrategy(AIStrategy):
                 self._adaptive_weight_adjustment(hybrid_decision)
 
             self.decisions_made += 1
-            logger.info(f"🎉 混合AI决策完成: {hybrid_decision.action.action_type.value}, "
-                      f"共识分数: {hybrid_decision.consensus_score:.2f}, "
-                      f"耗时: {hybrid_decision.execution_time:.3f}s")
-            logger.info(f"💭 推理过程: {hybrid_decision.action.reasoning}")
+            logger.info("🎉 混合AI决策完成: %s, 共识分数: %.2f, 耗时: %.3fs",
+                        hybrid_decision.action.action_type.value,
+                        hybrid_decision.consensus_score,
+                        hybrid_decision.execution_time)
+            logger.info("💭 推理过程: %s", hybrid_decision.action.reasoning)
 
             # 显示参与决策的策略
-            if hybrid_decision.participating_strategies:
-                logger.info(f"👥 参与策略: {', '.join(hybrid_decision.participating_strategies)}")
+            if hybrid_decision.participating_strategies and logger.isEnabledFor(logging.INFO):
+                logger.info("👥 参与策略: %s", ', '.join(hybrid_decision.participating_strategies))
 
             return hybrid_decision.action
 
         except Exception as e:
-            logger.error(f"💥 混合AI决策失败: {e}")
+            logger.error("💥 混合AI决策失败: %s", e)
             self.consensus_failures += 1
             return await self._fallback_decision(context)
 
@@ -214,7 +216,7 @@ class HybridAIStrategy(AIStrategy):
                 if isinstance(result, tuple) and result[0] and result[1]:
                     decisions.append(result)
                 elif isinstance(result, Exception):
-                    logger.error(f"策略执行异常: {result}")
+                    logger.error("策略执行异常: %s", result)
 
         return decisions
 
@@ -226,10 +228,10 @@ class HybridAIStrategy(AIStrategy):
             # 根据配置动态设置超时时间
             if strategy_name == "llm_enhanced":
                 timeout = self.config.get("llm_timeout_grace_period", 15.0)
-                logger.info(f"🧠 执行LLM增强策略（超时: {timeout}秒）...")
+                logger.info("🧠 执行LLM增强策略（超时: %s秒）...", timeout)
             else:
                 timeout = 6.0  # 规则策略给6秒，稍微增加但保持响应性
-                logger.info(f"📋 执行规则策略（超时: {timeout}秒）...")
+                logger.info("📋 执行规则策略（超时: %s秒）...", timeout)
 
             action = await asyncio.wait_for(
                 strategy.execute_with_timing(context),
@@ -238,14 +240,15 @@ class HybridAIStrategy(AIStrategy):
 
             if action:
                 self.strategy_usage_count[strategy_name] += 1
-                logger.info(f"✅ 策略 {strategy_name} 决策完成: {action.action_type.value}, "
-                          f"置信度: {action.confidence:.2f}, 耗时: {action.execution_time:.3f}s")
+                logger.info("✅ 策略 %s 决策完成: %s, 置信度: %.2f, 耗时: %.3fs",
+                            strategy_name, action.action_type.value,
+                            action.confidence, action.execution_time)
                 return strategy_name, action
             else:
-                logger.warning(f"❌ 策略 {strategy_name} 无法做出决策")
+                logger.warning("❌ 策略 %s 无法做出决策", strategy_name)
 
         except asyncio.TimeoutError:
-            logger.warning(f"⏰ 策略 {strategy_name} 执行超时（{timeout}秒）")
+            logger.warning("⏰ 策略 %s 执行超时（%s秒）", strategy_name, timeout)
 
             # LLM策略超时时的特殊处理
             if strategy_name == "llm_enhanced" and self.config.get("fallback_to_rules_on_timeout", True):
@@ -259,13 +262,13 @@ class HybridAIStrategy(AIStrategy):
                             timeout=3.0
                         )
                         if fallback_action:
-                            logger.info(f"🛡️ 规则策略回退成功: {fallback_action.action_type.value}")
+                            logger.info("🛡️ 规则策略回退成功: %s", fallback_action.action_type.value)
                             return "rule_based_fallback", fallback_action
                     except Exception as fallback_error:
-                        logger.error(f"回退规则策略也失败: {fallback_error}")
+                        logger.error("回退规则策略也失败: %s", fallback_error)
 
         except Exception as e:
-            logger.error(f"💥 策略 {strategy_name} 执行失败: {e}")
+            logger.error("💥 策略 %s 执行失败: %s", strategy_name, e)
 
         return strategy_name, None
 
@@ -515,10 +518,10 @@ class HybridAIStrategy(AIStrategy):
             try:
                 fallback_strategy = self.sub_strategies[fallback_name]
                 action = await fallback_strategy.execute_with_timing(context)
-                logger.info(f"使用回退策略: {fallback_name}")
+                logger.info("使用回退策略: %s", fallback_name)
                 return action
             except Exception as e:
-                logger.error(f"回退策略也失败: {e}")
+                logger.error("回退策略也失败: %s", e)
 
         # 最后的保险：结束回合
         return AIAction(
@@ -573,7 +576,7 @@ class HybridAIStrategy(AIStrategy):
                 scores.append(score)
                 weights.append(weight)
             except Exception as e:
-                logger.warning(f"策略 {strategy_name} 评估局面失败: {e}")
+                logger.warning("策略 %s 评估局面失败: %s", strategy_name, e)
 
         if not scores:
             return 0.0
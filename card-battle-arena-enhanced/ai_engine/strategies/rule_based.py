@@ -2,6 +2,8 @@
 基于规则的AI策略实现
 参考原始card-battle-arena项目的AI逻辑，并进行增强
 """
+from collections import OrderedDict
+from dataclasses import replace
 from typing import Dict, List, Any, Optional, Tuple
 import time
 import random
@@ -9,6 +11,26 @@ import asyncio
 from .base import AIStrategy, AIAction, ActionType, GameContext, AIStrategyError
 
 
+# 英雄技能伤害（简化实现：法师技能造成1点伤害）
+HERO_POWER_DAMAGE = 1
+# 英雄生命值上限，与 game_engine 中 Player.max_health 一致，治疗法术不会超过此值
+HERO_MAX_HEALTH = 30
+# 单次决策内评估缓存的最大条目数，防止调试脚本长时间探测时无限增长
+EVAL_CACHE_MAX_SIZE = 256
+# 置换表默认容量（跨决策复用相同局面的最优动作）
+TRANSPOSITION_TABLE_SIZE = 4096
+# 前瞻搜索默认深度（动作步数，结束回合后轮到对手行动），0表示直接按置信度选择
+SEARCH_DEPTH = 3
+# 搜索中每个节点最多展开的动作数（按启发式排序后截断，结束回合始终保留）
+SEARCH_WIDTH = 8
+# 搜索中分出胜负时的局面分数，远大于 evaluate_board_state 的取值范围
+WIN_SCORE = 10.0
+# 迭代加深的默认时间预算(秒)：完成一轮迭代后超出预算就不再加深
+SEARCH_TIME_BUDGET = 0.2
+# 搜索置换表中记录的分数类型：精确值 / 下界（发生beta剪枝）/ 上界（发生alpha剪枝）
+BOUND_EXACT, BOUND_LOWER, BOUND_UPPER = 0, 1, 2
+
+
 class RuleBasedStrategy(AIStrategy):
     """基于规则的AI策略"""
 
@@ -27,18 +49,109 @@ class RuleBasedStrategy(AIStrategy):
                 "stealth": 0.2
             },
             "min_thinking_time": 0.1,      # 最小思考时间(秒)
-            "max_thinking_time": 2.0       # 最大思考时间(秒)
+            "max_thinking_time": 2.0,      # 最大思考时间(秒)
+            "transposition_table_size": TRANSPOSITION_TABLE_SIZE,  # 置换表容量
+            "search_depth": SEARCH_DEPTH,  # 前瞻搜索深度
+            "search_width": SEARCH_WIDTH,  # 每个搜索节点展开的动作数上限
+            "search_time_budget": SEARCH_TIME_BUDGET  # 迭代加深的时间预算(秒)
         }
         if config:
             default_config.update(config)
 
         super().__init__(name, default_config)
+        # 评估缓存：(方法标签, 局面指纹) -> 评估结果，每次决策开始时重置
+        # 只有决策协程本身写入，无需加锁
+        self._eval_cache: Dict[Tuple[str, Tuple], Any] = {}
+        # 置换表：局面指纹 -> 最优动作（索引形式），按LRU淘汰，命中时按当前局面重建动作
+        self._tt: "OrderedDict[Tuple, Tuple]" = OrderedDict()
+        # 最近一次搜索（最深一轮迭代）评估的叶子局面数和完成的深度
+        self._search_leaves = 0
+        self._search_completed_depth = 0
+        # 搜索内置换表：(剩余深度, 规范化局面) -> (分数类型, 分数)，每次决策开始时重置
+        self._search_tt: Dict[Tuple, Tuple[int, float]] = {}
+        # 最佳动作表：规范化局面 -> 上一轮迭代的最佳动作，下一轮优先展开
+        self._best_moves: Dict[Tuple, Tuple] = {}
+
+    @staticmethod
+    def _context_key(context: GameContext) -> Tuple:
+        """
+        计算局面指纹，字段与 _search_key 一致
+
+        保留手牌和场面的排列顺序：置换表中的动作按位置引用卡牌和随从
+        """
+        return (
+            context.player_mana, context.opponent_mana,
+            context.player_health, context.opponent_health,
+            tuple((c.get("name") or "", c.get("cost", 0), c.get("attack", 0), c.get("health", 0),
+                   c.get("card_type") or "", tuple(c.get("mechanics") or ()))
+                  for c in context.player_hand),
+            tuple((m.get("name") or "", m.get("attack", 0), m.get("health", 0),
+                   m.get("can_attack", False), tuple(m.get("mechanics") or ()))
+                  for m in context.player_field),
+            tuple((m.get("name") or "", m.get("attack", 0), m.get("health", 0),
+                   m.get("can_attack", False), tuple(m.get("mechanics") or ()))
+                  for m in context.opponent_field),
+        )
+
+    def _cached_evaluation(self, tag: str, context: GameContext, evaluate):
+        """在当前决策范围内复用相同局面的评估结果"""
+        key = (tag, self._context_key(context))
+        try:
+            return self._eval_cache[key]
+        except KeyError:
+            pass
+        if len(self._eval_cache) >= EVAL_CACHE_MAX_SIZE:
+            self._eval_cache.clear()
+        result = self._eval_cache[key] = evaluate(context)
+        return result
 
     async def make_decision(self, context: GameContext) -> Optional[AIAction]:
         """
         基于规则做出决策
-        决策优先级：出牌 -> 攻击 -> 使用英雄技能 -> 结束回合
+        候选动作：出牌、攻击、使用英雄技能，没有候选动作时结束回合；
+        候选动作经过 alpha-beta 前瞻搜索比较，搜索分数相同时取置信度最高者
         """
+        # 评估缓存只在一次决策内有效，缓存的动作引用的是本次局面中的卡牌
+        self._eval_cache = {}
+        fingerprint = self._context_key(context)
+        move = self._tt.get(fingerprint)
+        best_action = self._move_to_action(context, move) if move is not None else None
+        if best_action is not None:
+            self._tt.move_to_end(fingerprint)
+        else:
+            best_action = self._search_best_action(context)
+            move = self._action_to_move(context, best_action)
+            if move is not None:
+                self._tt[fingerprint] = move
+                if len(self._tt) > self.config["transposition_table_size"]:
+                    self._tt.popitem(last=False)
+
+        # 模拟思考时间
+        thinking_time = min(
+            max(self.config["min_thinking_time"],
+                random.uniform(0.1, 0.5)),
+            self.config["max_thinking_time"]
+        )
+        await asyncio.sleep(thinking_time)
+
+        return best_action
+
+    def _search_best_action(self, context: GameContext) -> AIAction:
+        """评估所有候选动作并选出最优动作"""
+        possible_actions = self._candidate_actions(context)
+
+        # 如果没有其他动作，考虑结束回合
+        if not possible_actions:
+            return self._end_turn_action()
+
+        # 选择最优动作
+        depth = self.config["search_depth"]
+        if depth <= 0:
+            return self._select_best_action(possible_actions)
+        return self._search_with_lookahead(context, possible_actions, depth)
+
+    def _candidate_actions(self, context: GameContext) -> List[AIAction]:
+        """生成出牌、攻击和英雄技能候选动作"""
         possible_actions = []
 
         # 1. 评估出牌动作
@@ -54,30 +167,266 @@ class RuleBasedStrategy(AIStrategy):
         if hero_power_action:
             possible_actions.append(hero_power_action)
 
-        # 4. 如果没有其他动作，考虑结束回合
-        if not possible_actions:
-            return AIAction(
-                action_type=ActionType.END_TURN,
-                confidence=0.9,
-                reasoning="没有可执行的战术动作",
-                parameters={}
-            )
-
-        # 选择最优动作
-        best_action = self._select_best_action(possible_actions)
+        return possible_actions
 
-        # 模拟思考时间
-        thinking_time = min(
-            max(self.config["min_thinking_time"],
-                random.uniform(0.1, 0.5)),
-            self.config["max_thinking_time"]
+    @staticmethod
+    def _end_turn_action() -> AIAction:
+        return AIAction(
+            action_type=ActionType.END_TURN,
+            confidence=0.9,
+            reasoning="没有可执行的战术动作",
+            parameters={}
         )
-        await asyncio.sleep(thinking_time)
+
+    def _move_to_action(self, context: GameContext, move: Tuple) -> Optional[AIAction]:
+        """按当前局面重建索引形式动作对应的候选动作，找不到时返回None"""
+        if move == ("end",):
+            return self._end_turn_action()
+        for action in self._candidate_actions(context):
+            if self._action_to_move(context, action) == move:
+                return action
+        return None
+
+    def _search_with_lookahead(self, context: GameContext, actions: List[AIAction],
+                               depth: int) -> AIAction:
+        """
+        对候选动作做迭代加深的 alpha-beta 前瞻搜索，分数相同时保留置信度更高的动作
+
+        从深度1开始逐轮加深，置换表和最佳动作表跨轮复用；
+        每完成一轮都有可用结果，超出时间预算时返回最深一轮的结果
+        """
+        self._search_tt = {}
+        self._best_moves = {}
+        ordered = sorted(actions, key=lambda x: x.confidence, reverse=True)[:self.config["search_width"]]
+        root_moves = [(action, self._action_to_move(context, action)) for action in ordered]
+        root_moves = [(action, move) for action, move in root_moves if move is not None]
+        best_action = ordered[0]
+        deadline = time.perf_counter() + self.config["search_time_budget"]
+
+        for iteration_depth in range(1, depth + 1):
+            self._search_leaves = 0
+            best_value = alpha = -float("inf")
+            for action, move in root_moves:
+                child, maximizing = self._apply_move(context, move, True)
+                value = self._alphabeta(child, iteration_depth - 1, alpha, float("inf"), maximizing)
+                if value > best_value:
+                    best_value, best_action = value, action
+                    alpha = value
+            self._search_completed_depth = iteration_depth
+            if time.perf_counter() > deadline:
+                break
 
         return best_action
 
+    def _alphabeta(self, context: GameContext, depth: int, alpha: float, beta: float,
+                   maximizing: bool) -> float:
+        """深度受限的 minimax 搜索（alpha-beta 剪枝），分数始终以我方视角计算"""
+        # 分出胜负时直接返回，剩余深度越大说明斩杀越早
+        if context.opponent_health <= 0:
+            return WIN_SCORE + depth
+        if context.player_health <= 0:
+            return -WIN_SCORE - depth
+        if depth <= 0:
+            self._search_leaves += 1
+            return self.evaluate_board_state(context)
+
+        # 不同出牌/攻击顺序常常到达同一局面，命中置换表时直接复用或收窄窗口
+        position = self._search_key(context, maximizing)
+        key = (depth, position)
+        entry = self._search_tt.get(key)
+        if entry is not None:
+            bound, cached = entry
+            if bound == BOUND_EXACT:
+                return cached
+            if bound == BOUND_LOWER:
+                alpha = max(alpha, cached)
+            else:
+                beta = min(beta, cached)
+            if alpha >= beta:
+                return cached
+        original_alpha, original_beta = alpha, beta
+
+        # 上一轮迭代在该局面找到的最佳动作优先展开
+        moves = self._legal_moves(context, maximizing)
+        best_move = self._best_moves.get(position)
+        if best_move is not None and best_move in moves:
+            moves.remove(best_move)
+            moves.insert(0, best_move)
+
+        if maximizing:
+            value = -float("inf")
+            for move in moves:
+                child, child_maximizing = self._apply_move(context, move, True)
+                score = self._alphabeta(child, depth - 1, alpha, beta, child_maximizing)
+                if score > value:
+                    value, best_move = score, move
+                if value >= beta:
+                    break
+                alpha = max(alpha, value)
+        else:
+            value = float("inf")
+            for move in moves:
+                child, child_maximizing = self._apply_move(context, move, False)
+                score = self._alphabeta(child, depth - 1, alpha, beta, child_maximizing)
+                if score < value:
+                    value, best_move = score, move
+                if value <= alpha:
+                    break
+                beta = min(beta, value)
+        self._best_moves[position] = best_move
+
+        if value <= original_alpha:
+            self._search_tt[key] = (BOUND_UPPER, value)
+        elif value >= original_beta:
+            self._search_tt[key] = (BOUND_LOWER, value)
+        else:
+            self._search_tt[key] = (BOUND_EXACT, value)
+        return value
+
+    @staticmethod
+    def _search_key(context: GameContext, maximizing: bool) -> Tuple:
+        """搜索节点的规范化指纹：手牌和场面按多重集合比较，与排列顺序无关"""
+        return (
+            maximizing,
+            context.player_mana, context.opponent_mana,
+            context.player_health, context.opponent_health,
+            tuple(sorted((c.get("name") or "", c.get("cost", 0), c.get("attack", 0), c.get("health", 0),
+                          c.get("card_type") or "", tuple(c.get("mechanics") or ()))
+                         for c in context.player_hand)),
+            tuple(sorted((m.get("name") or "", m.get("attack", 0), m.get("health", 0),
+                          m.get("can_attack", False), tuple(m.get("mechanics") or ()))
+                         for m in context.player_field)),
+            tuple(sorted((m.get("name") or "", m.get("attack", 0), m.get("health", 0),
+                          m.get("can_attack", False), tuple(m.get("mechanics") or ()))
+                         for m in context.opponent_field)),
+        )
+
+    @staticmethod
+    def _action_to_move(context: GameContext, action: AIAction) -> Optional[Tuple]:
+        """把候选动作转换为搜索用的索引形式动作"""
+        params = action.parameters
+        if action.action_type == ActionType.PLAY_CARD:
+            card = params.get("card")
+            for index, hand_card in enumerate(context.player_hand):
+                if hand_card is card:
+                    return ("play", index)
+        elif action.action_type == ActionType.ATTACK:
+            attacker, target = params.get("attacker"), params.get("target")
+            attacker_index = next((i for i, m in enumerate(context.player_field) if m is attacker), None)
+            if attacker_index is None:
+                return None
+            if target == "opponent_hero":
+                return ("attack", attacker_index, -1)
+            for index, enemy_minion in enumerate(context.opponent_field):
+                if enemy_minion is target:
+                    return ("attack", attacker_index, index)
+        elif action.action_type == ActionType.USE_HERO_POWER:
+            return ("hero_power",)
+        elif action.action_type == ActionType.END_TURN:
+            return ("end",)
+        return None
+
+    def _legal_moves(self, context: GameContext, maximizing: bool) -> List[Tuple]:
+        """
+        生成当前行动方的可选动作，按启发式排序以尽早剪枝
+
+        对手手牌不可见，对手回合只考虑随从攻击和英雄技能
+        """
+        if maximizing:
+            hand, own, enemy, mana = (context.player_hand, context.player_field,
+                                      context.opponent_field, context.player_mana)
+        else:
+            hand, own, enemy, mana = (), context.opponent_field, context.player_field, context.opponent_mana
+
+        # 可斩杀的法术最先尝试，其余出牌按法力效率（攻击力/费用）排序
+        plays = [(i, card) for i, card in enumerate(hand) if card.get("cost", 0) <= mana]
+        opponent_health = context.opponent_health
+        plays.sort(key=lambda item: (item[1].get("card_type") == "spell"
+                                     and item[1].get("attack", 0) >= opponent_health,
+                                     item[1].get("attack", 0) / max(1, item[1].get("cost", 0))),
+                   reverse=True)
+        moves = [("play", i) for i, _ in plays]
+
+        # 有嘲讽时只能攻击嘲讽随从，潜行随从无法被攻击
+        visible = [i for i, m in enumerate(enemy) if "stealth" not in (m.get("mechanics") or ())]
+        taunts = [i for i in visible if "taunt" in (enemy[i].get("mechanics") or ())]
+        targets = taunts or [-1] + visible
+        attackers = [i for i, m in enumerate(own) if m.get("can_attack", False) and m.get("attack", 0) > 0]
+        attackers.sort(key=lambda i: own[i].get("attack", 0), reverse=True)
+        moves.extend(("attack", i, j) for i in attackers for j in targets)
+
+        if mana >= 2:
+            moves.append(("hero_power",))
+
+        del moves[self.config["search_width"] - 1:]
+        moves.append(("end",))
+        return moves
+
+    @staticmethod
+    def _apply_move(context: GameContext, move: Tuple, maximizing: bool) -> Tuple[GameContext, bool]:
+        """
+        模拟执行动作，返回新局面和下一步是否仍由我方行动
+
+        只复制被修改的列表和随从字典，原局面保持不变
+        """
+        own_name, enemy_name = ("player_field", "opponent_field") if maximizing else ("opponent_field", "player_field")
+        mana_name = "player_mana" if maximizing else "opponent_mana"
+        enemy_health_name = "opponent_health" if maximizing else "player_health"
+        kind = move[0]
+
+        if kind == "end":
+            # 回合结束，另一方的随从恢复攻击能力
+            ready = [dict(m, can_attack=True) for m in getattr(context, enemy_name)]
+            return replace(context, **{enemy_name: ready}), not maximizing
+
+        changes = {}
+        if kind == "play":
+            hand = list(context.player_hand)
+            card = hand.pop(move[1])
+            changes["player_hand"] = hand
+            changes["player_mana"] = context.player_mana - card.get("cost", 0)
+            if card.get("card_type") == "minion":
+                mechanics = card.get("mechanics") or ()
+                changes["player_field"] = context.player_field + [dict(card, can_attack="charge" in mechanics)]
+            else:
+                # 简化处理：正攻击力的法术伤害直接打在对手英雄上，负攻击力表示治疗自己，
+                # 攻击力为0的功能性法术不影响生命值
+                attack = card.get("attack", 0)
+                if attack > 0:
+                    changes["opponent_health"] = context.opponent_health - attack
+                elif attack < 0:
+                    changes["player_health"] = min(HERO_MAX_HEALTH, context.player_health - attack)
+        elif kind == "hero_power":
+            changes[mana_name] = getattr(context, mana_name) - 2
+            changes[enemy_health_name] = getattr(context, enemy_health_name) - HERO_POWER_DAMAGE
+        else:
+            own = list(getattr(context, own_name))
+            attacker = dict(own[move[1]], can_attack=False)
+            if move[2] < 0:
+                changes[enemy_health_name] = getattr(context, enemy_health_name) - attacker.get("attack", 0)
+            else:
+                enemy = list(getattr(context, enemy_name))
+                defender = dict(enemy[move[2]])
+                defender["health"] = defender.get("health", 0) - attacker.get("attack", 0)
+                attacker["health"] = attacker.get("health", 0) - defender.get("attack", 0)
+                if defender["health"] > 0:
+                    enemy[move[2]] = defender
+                else:
+                    del enemy[move[2]]
+                changes[enemy_name] = enemy
+            if attacker.get("health", 0) > 0:
+                own[move[1]] = attacker
+            else:
+                del own[move[1]]
+            changes[own_name] = own
+
+        return replace(context, **changes), maximizing
+
     def _evaluate_play_cards(self, context: GameContext) -> List[AIAction]:
         """评估所有可出的卡牌"""
+        return self._cached_evaluation("play", context, self._compute_play_cards)
+
+    def _compute_play_cards(self, context: GameContext) -> List[AIAction]:
         actions = []
 
         for card in context.player_hand:
@@ -154,34 +503,65 @@ class RuleBasedStrategy(AIStrategy):
 
     def _evaluate_attacks(self, context: GameContext) -> List[AIAction]:
         """评估所有可能的攻击动作"""
+        return self._cached_evaluation("attack", context, self._compute_attacks)
+
+    def _compute_attacks(self, context: GameContext) -> List[AIAction]:
         actions = []
+        lethal = self._has_lethal(context)
+
+        # 预先提取目标属性，避免在攻击者×目标的双重循环里重复查字典；潜行随从无法被攻击
+        targets = []
+        for enemy_minion in context.opponent_field:
+            mechanics = enemy_minion.get("mechanics") or ()
+            if "stealth" not in mechanics:
+                targets.append((enemy_minion, enemy_minion.get("name", "Unknown"),
+                                enemy_minion.get("health", 0), enemy_minion.get("attack", 0),
+                                "taunt" in mechanics))
 
         for minion in context.player_field:
-            if minion.get("can_attack", False) and minion.get("attack", 0) > 0:
-                # 评估攻击对手英雄
+            attack_power = minion.get("attack", 0)
+            if minion.get("can_attack", False) and attack_power > 0:
+                minion_name = minion.get("name", "Unknown")
+                minion_health = minion.get("health", 0)
+
+                # 评估攻击对手英雄，可斩杀时直接打脸
                 face_attack_score = self._calculate_face_attack_score(minion, context)
                 actions.append(AIAction(
                     action_type=ActionType.ATTACK,
-                    confidence=min(0.9, face_attack_score / 10),
-                    reasoning=f"用 {minion.get('name', 'Unknown')} 攻击对手英雄",
+                    confidence=0.9 if lethal else min(0.9, face_attack_score / 10),
+                    reasoning=f"用 {minion_name} 攻击对手英雄",
                     parameters={"attacker": minion, "target": "opponent_hero"}
                 ))
 
                 # 评估攻击对手随从
-                for enemy_minion in context.opponent_field:
-                    attack_score = self._calculate_minion_attack_score(minion, enemy_minion, context)
+                for enemy_minion, enemy_name, target_health, target_attack, is_taunt in targets:
+                    attack_score = self._trade_score(attack_power, minion_health,
+                                                     target_health, target_attack, is_taunt)
                     if attack_score > 0:
                         actions.append(AIAction(
                             action_type=ActionType.ATTACK,
                             confidence=min(0.8, attack_score / 10),
-                            reasoning=f"用 {minion.get('name', 'Unknown')} 攻击 {enemy_minion.get('name', 'Unknown')}",
+                            reasoning=f"用 {minion_name} 攻击 {enemy_name}",
                             parameters={"attacker": minion, "target": enemy_minion}
                         ))
 
         return sorted(actions, key=lambda x: x.confidence, reverse=True)
 
+    def _has_lethal(self, context: GameContext) -> bool:
+        """判断本回合能否直接击杀对手英雄"""
+        hero_power_damage = HERO_POWER_DAMAGE if context.player_mana >= 2 else 0
+        ready_attack = sum(m.get("attack", 0) for m in context.player_field
+                           if m.get("can_attack", False))
+        # 伤害上限都不够时跳过后续判断
+        if ready_attack + hero_power_damage < context.opponent_health:
+            return False
+        return not any("taunt" in (m.get("mechanics") or ()) for m in context.opponent_field)
+
     def _evaluate_hero_power(self, context: GameContext) -> Optional[AIAction]:
         """评估使用英雄技能"""
+        return self._cached_evaluation("hero_power", context, self._compute_hero_power)
+
+    def _compute_hero_power(self, context: GameContext) -> Optional[AIAction]:
         if context.player_mana < 2:
             return None
 
@@ -285,13 +665,17 @@ class RuleBasedStrategy(AIStrategy):
 
         # 检查目标特性
         target_mechanics = target.get("mechanics", [])
-        is_taunt = "taunt" in target_mechanics
-        is_stealth = "stealth" in target_mechanics
 
         # 无法攻击潜行随从
-        if is_stealth:
+        if "stealth" in target_mechanics:
             return 0
 
+        return self._trade_score(attack_power, attacker_health, target_health,
+                                 target_attack, "taunt" in target_mechanics)
+
+    def _trade_score(self, attack_power: int, attacker_health: int,
+                     target_health: int, target_attack: int, is_taunt: bool) -> float:
+        """根据双方攻防数值计算随从交换分数"""
         score = 0.0
 
         # 击杀收益
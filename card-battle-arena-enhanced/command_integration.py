@@ -4,11 +4,15 @@
 """
 
 from typing import Tuple, Optional, Dict, Any
+import asyncio
 import logging
 from command_processor import UnifiedCommandProcessor, CommandContext
 
 logger = logging.getLogger(__name__)
 
+# 输入队列容量
+INPUT_QUEUE_SIZE = 64
+
 
 class CommandIntegration:
     """命令系统集成类"""
@@ -19,6 +23,11 @@ class CommandIntegration:
         self.processor = UnifiedCommandProcessor()
         self._setup_handlers()
 
+        # 输入队列与常驻消费任务（首次输入时在当前事件循环中创建）
+        self._input_q: Optional[asyncio.Queue] = None
+        self._consumer_task: Optional[asyncio.Task] = None
+        self._consumer_loop: Optional[asyncio.AbstractEventLoop] = None
+
     def _setup_handlers(self):
         """设置命令处理器（兼容性处理）"""
         # 注册兼容性处理器
@@ -69,25 +78,75 @@ class CommandIntegration:
     async def process_user_input(self, user_input: str, player_idx: int,
                                 game_state: Dict[str, Any] = None,
                                 available_commands: list = None) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
-        """处理用户输入的主接口"""
+        """处理用户输入的主接口
+
+        输入被放入队列，由常驻消费任务按顺序处理，结果通过 Future 返回。
+        """
+        # 创建命令上下文
+        context = CommandContext(
+            game=self.game,
+            ui=self.ui,
+            player_idx=player_idx,
+            command_text=user_input,
+            game_state=game_state,
+            available_commands=available_commands or []
+        )
+
+        # 命令处理器在消费任务内再次提交输入时直接分发，避免等待自己的队列而死锁
+        if asyncio.current_task() is self._consumer_task:
+            return await self._dispatch(context)
+
+        self._ensure_consumer()
+        future = self._consumer_loop.create_future()
+        await self._input_q.put((context, future))
+        return await future
+
+    def _ensure_consumer(self):
+        """确保当前事件循环中有一个常驻的输入消费任务"""
+        loop = asyncio.get_running_loop()
+        if (self._consumer_task is None or self._consumer_task.done()
+                or self._consumer_loop is not loop):
+            self._input_q = asyncio.Queue(maxsize=INPUT_QUEUE_SIZE)
+            self._consumer_loop = loop
+            self._consumer_task = loop.create_task(self._consume())
+
+    async def _consume(self):
+        """消费输入队列：按顺序逐条分发；任务结束时让处理中和排队中的输入失败，调用方不会一直等待"""
+        queue = self._input_q
+        future = None
+        try:
+            while True:
+                context, future = await queue.get()
+                result = await self._dispatch(context)
+                if not future.done():
+                    future.set_result(result)
+                future = None
+        finally:
+            pending = [] if future is None else [future]
+            while not queue.empty():
+                pending.append(queue.get_nowait()[1])
+            for waiting in pending:
+                if not waiting.done():
+                    waiting.set_exception(RuntimeError("输入消费任务已停止"))
+
+    async def _dispatch(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """使用统一命令处理器处理单条输入"""
         try:
-            # 创建命令上下文
-            context = CommandContext(
-                game=self.game,
-                ui=self.ui,
-                player_idx=player_idx,
-                command_text=user_input,
-                game_state=game_state,
-                available_commands=available_commands or []
-            )
-
-            # 使用统一命令处理器处理
             return await self.processor.process_command(context)
-
         except Exception as e:
-            logger.error(f"命令处理错误: {e}")
+            logger.error("命令处理错误: %s", e)
             return False, f"命令处理失败: {str(e)}", None
 
+    async def close(self):
+        """停止输入消费任务"""
+        if self._consumer_task is not None and not self._consumer_task.done():
+            self._consumer_task.cancel()
+            try:
+                await self._consumer_task
+            except asyncio.CancelledError:
+                pass
+        self._consumer_task = None
+
     def get_available_commands_for_context(self, player_idx: int) -> list:
         """获取指定玩家的可用命令"""
         # 复用现有的游戏命令获取逻辑
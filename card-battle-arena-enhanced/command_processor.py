@@ -14,6 +14,24 @@ from commands.game_commands import (
 
 logger = logging.getLogger(__name__)
 
+# 默认注册的命令类型
+DEFAULT_COMMANDS = (
+    PlayCardCommand, AttackCommand, SpellCommand, SkillCommand,
+    HeroAttackCommand, EndTurnCommand, HelpCommand, StatusCommand
+)
+
+# 格式化命令类型 -> (兼容性处理器键, 命令显示名)
+HANDLER_KEYS = {
+    'play': ('play_handler', '出牌'),
+    'attack': ('attack_handler', '攻击'),
+    'spell': ('spell_handler', '法术'),
+    'skill': ('skill_handler', '技能'),
+    'hero_attack': ('hero_attack_handler', '英雄攻击'),
+    'end_turn': ('end_turn_handler', '结束回合'),
+    'help': ('help_handler', '帮助'),
+    'status': ('status_handler', '状态'),
+}
+
 
 class UnifiedCommandProcessor:
     """统一命令处理器"""
@@ -25,25 +43,14 @@ class UnifiedCommandProcessor:
 
     def _register_default_commands(self):
         """注册默认命令"""
-        default_commands = [
-            PlayCardCommand(),
-            AttackCommand(),
-            SpellCommand(),
-            SkillCommand(),
-            HeroAttackCommand(),
-            EndTurnCommand(),
-            HelpCommand(),
-            StatusCommand()
-        ]
-
-        for command in default_commands:
-            self.register_command(command)
+        for command_cls in DEFAULT_COMMANDS:
+            self.register_command(command_cls())
 
     def register_command(self, command: Command):
-        """注册命令"""
-        self.commands[command.name] = command
+        """注册命令（名称和别名统一以小写存储）"""
+        self.commands[command.name.lower()] = command
         for alias in command.aliases:
-            self.commands[alias] = command
+            self.commands[alias.lower()] = command
 
     def register_handler(self, command_type: str, handler: Callable):
         """注册命令处理器（兼容性）"""
@@ -54,17 +61,16 @@ class UnifiedCommandProcessor:
         command_text = context.command_text.strip()
 
         # 首先尝试匹配注册的命令
-        for command_name, command in self.commands.items():
-            if command.matches(command_text):
-                if command.can_execute(context):
-                    try:
-                        return await command.execute(context)
-                    except Exception as e:
-                        error_msg = f"命令执行失败: {str(e)}"
-                        logger.error(error_msg)
-                        return False, error_msg, None
-                else:
-                    return False, f"当前无法执行命令: {command.name}", None
+        command = self.commands.get(command_text.lower())
+        if command is not None:
+            if command.can_execute(context):
+                try:
+                    return await command.execute(context)
+                except Exception as e:
+                    logger.error("命令执行失败: %s", e)
+                    return False, f"命令执行失败: {str(e)}", None
+            else:
+                return False, f"当前无法执行命令: {command.name}", None
 
         # 尝试解析为数字命令
         if command_text.isdigit():
@@ -99,94 +105,55 @@ class UnifiedCommandProcessor:
 
         # 出牌命令
         if command_text.startswith('出牌 ') or command_text.startswith('play '):
-            return await self._handle_play_command(context)
+            return await self._dispatch_handler('play', context)
 
         # 攻击命令
         if (command_text.startswith('随从攻击 ') or command_text.startswith('attack ') or
             "攻击" in command_text):
-            return await self._handle_attack_command(context)
+            return await self._dispatch_handler('attack', context)
 
         # 法术命令
         if "法术" in command_text:
-            return await self._handle_spell_command(context)
+            return await self._dispatch_handler('spell', context)
 
         # 技能命令
         if command_text in ['英雄技能', '技能', '技', 'power']:
-            return await self._handle_skill_command(context)
+            return await self._dispatch_handler('skill', context)
 
         # 英雄攻击命令
         if command_text in ['英雄攻击', 'hero']:
-            return await self._handle_hero_attack_command(context)
+            return await self._dispatch_handler('hero_attack', context)
 
         # 结束回合命令
         if command_text in ['结束回合', '结束', 'end']:
-            return await self._handle_end_turn_command(context)
+            return await self._dispatch_handler('end_turn', context)
 
         # 帮助命令
         if command_text in ['帮助', '帮', 'help', 'h']:
-            return await self._handle_help_command(context)
+            return await self._dispatch_handler('help', context)
 
         # 状态命令
         if command_text in ['状态', 'status']:
-            return await self._handle_status_command(context)
+            return await self._dispatch_handler('status', context)
 
         return False, f"未知命令: {context.command_text}", None
 
-    async def _handle_play_command(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
-        """处理出牌命令"""
-        if 'play_handler' in self.command_handlers:
-            return await self.command_handlers['play_handler'](context)
-        return False, "出牌命令处理器未注册", None
-
-    async def _handle_attack_command(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
-        """处理攻击命令"""
-        if 'attack_handler' in self.command_handlers:
-            return await self.command_handlers['attack_handler'](context)
-        return False, "攻击命令处理器未注册", None
-
-    async def _handle_spell_command(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
-        """处理法术命令"""
-        if 'spell_handler' in self.command_handlers:
-            return await self.command_handlers['spell_handler'](context)
-        return False, "法术命令处理器未注册", None
-
-    async def _handle_skill_command(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
-        """处理技能命令"""
-        if 'skill_handler' in self.command_handlers:
-            return await self.command_handlers['skill_handler'](context)
-        return False, "技能命令处理器未注册", None
-
-    async def _handle_hero_attack_command(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
-        """处理英雄攻击命令"""
-        if 'hero_attack_handler' in self.command_handlers:
-            return await self.command_handlers['hero_attack_handler'](context)
-        return False, "英雄攻击命令处理器未注册", None
-
-    async def _handle_end_turn_command(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
-        """处理结束回合命令"""
-        if 'end_turn_handler' in self.command_handlers:
-            return await self.command_handlers['end_turn_handler'](context)
-        return False, "结束回合命令处理器未注册", None
-
-    async def _handle_help_command(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
-        """处理帮助命令"""
-        if 'help_handler' in self.command_handlers:
-            return await self.command_handlers['help_handler'](context)
-
-        # 默认帮助
-        help_text = context.game.get_context_help()
-        context.ui.console.print(help_text)
-        return True, "显示帮助信息", None
-
-    async def _handle_status_command(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
-        """处理状态命令"""
-        if 'status_handler' in self.command_handlers:
-            return await self.command_handlers['status_handler'](context)
-
-        # 默认状态显示
-        context.game.display_status()
-        return True, "显示游戏状态", None
-
-
-# 全局命令处理器实例
-command_processor = UnifiedCommandProcessor()
\ No newline at end of file
+    async def _dispatch_handler(self, command_type: str, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
+        """将格式化命令分发给已注册的兼容性处理器"""
+        handler_key, label = HANDLER_KEYS[command_type]
+        handler = self.command_handlers.get(handler_key)
+        if handler:
+            return await handler(context)
+
+        if command_type == 'help':
+            # 默认帮助
+            help_text = context.game.get_context_help()
+            context.ui.console.print(help_text)
+            return True, "显示帮助信息", None
+
+        if command_type == 'status':
+            # 默认状态显示
+            context.game.display_status()
+            return True, "显示游戏状态", None
+
+        return False, f"{label}命令处理器未注册", None
@@ -5,6 +5,7 @@
 
 from typing import Dict, List, Tuple, Optional, Any
 import logging
+import shutil
 
 from .base import Command, CommandContext
 
@@ -45,7 +46,7 @@ class PlayCardCommand(Command):
         except (ValueError, IndexError):
             return False, "无效的出牌命令格式", None
         except Exception as e:
-            logger.error(f"出牌命令执行错误: {e}")
+            logger.error("出牌命令执行错误: %s", e)
             return False, f"出牌失败: {str(e)}", None
 
 
@@ -69,7 +70,7 @@ class AttackCommand(Command):
             else:
                 return False, "攻击处理功能未实现", None
         except Exception as e:
-            logger.error(f"攻击命令执行错误: {e}")
+            logger.error("攻击命令执行错误: %s", e)
             return False, f"攻击失败: {str(e)}", None
 
 
@@ -96,7 +97,7 @@ class SpellCommand(Command):
             else:
                 return False, "法术处理功能未实现", None
         except Exception as e:
-            logger.error(f"法术命令执行错误: {e}")
+            logger.error("法术命令执行错误: %s", e)
             return False, f"法术失败: {str(e)}", None
 
 
@@ -120,7 +121,7 @@ class SkillCommand(Command):
             else:
                 return False, result["message"], None
         except Exception as e:
-            logger.error(f"技能命令执行错误: {e}")
+            logger.error("技能命令执行错误: %s", e)
             return False, f"技能失败: {str(e)}", None
 
 
@@ -144,7 +145,7 @@ class HeroAttackCommand(Command):
             else:
                 return False, result["message"], None
         except Exception as e:
-            logger.error(f"英雄攻击命令执行错误: {e}")
+            logger.error("英雄攻击命令执行错误: %s", e)
             return False, f"英雄攻击失败: {str(e)}", None
 
 
@@ -167,7 +168,7 @@ class EndTurnCommand(Command):
             else:
                 return False, result["message"], None
         except Exception as e:
-            logger.error(f"结束回合命令执行错误: {e}")
+            logger.error("结束回合命令执行错误: %s", e)
             return False, f"结束回合失败: {str(e)}", None
 
 
@@ -176,6 +177,8 @@ class HelpCommand(Command):
 
     def __init__(self):
         super().__init__("help", "显示帮助信息", ["帮助", "帮", "h"])
+        # (状态版本号, 玩家索引) -> 帮助文本
+        self._help_cache: Dict[Tuple[int, int], str] = {}
 
     def can_execute(self, context: CommandContext) -> bool:
         """检查是否可以显示帮助"""
@@ -184,11 +187,16 @@ class HelpCommand(Command):
     async def execute(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """执行帮助命令"""
         try:
-            help_text = context.game.get_context_help()
+            key = (getattr(context.game, 'turn_version', None), context.player_idx)
+            help_text = self._help_cache.get(key)
+            if help_text is None:
+                help_text = context.game.get_context_help()
+                if key[0] is not None:
+                    self._help_cache = {key: help_text}
             context.ui.console.print(help_text)
             return True, "显示帮助信息", {"action": "show_help"}
         except Exception as e:
-            logger.error(f"帮助命令执行错误: {e}")
+            logger.error("帮助命令执行错误: %s", e)
             return False, f"显示帮助失败: {str(e)}", None
 
 
@@ -197,6 +205,8 @@ class StatusCommand(Command):
 
     def __init__(self):
         super().__init__("status", "显示游戏状态", ["状态", "status"])
+        # (状态版本号, 玩家索引, 终端宽度) -> 状态布局；布局按终端宽度计算表格列宽
+        self._layout_cache: Dict[Tuple[int, int, int], Any] = {}
 
     def can_execute(self, context: CommandContext) -> bool:
         """检查是否可以显示状态"""
@@ -205,8 +215,17 @@ class StatusCommand(Command):
     async def execute(self, context: CommandContext) -> Tuple[bool, str, Optional[Dict[str, Any]]]:
         """执行状态命令"""
         try:
-            context.game.display_status()
+            key = (getattr(context.game, 'turn_version', None), context.player_idx,
+                   shutil.get_terminal_size().columns)
+            if key[0] is None:
+                context.game.display_status()
+            else:
+                layout = self._layout_cache.get(key)
+                if layout is None:
+                    layout = context.game.build_status_layout()
+                    self._layout_cache = {key: layout}
+                context.game.display_status(layout=layout)
             return True, "显示游戏状态", {"action": "show_status"}
         except Exception as e:
-            logger.error(f"状态命令执行错误: {e}")
+            logger.error("状态命令执行错误: %s", e)
             return False, f"显示状态失败: {str(e)}", None
\ No newline at end of file
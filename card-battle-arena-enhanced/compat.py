@@ -0,0 +1,9 @@
+"""
+Python版本兼容工具
+项目支持 Python 3.8+，仅在新版本中可用的特性集中在这里判断
+"""
+import sys
+
+# dataclass 的 slots 参数需要 Python 3.10+，低版本退化为普通数据类
+# 用法: @dataclass(**DATACLASS_OPTIONS)，实例使用 __slots__ 以减小内存
+DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
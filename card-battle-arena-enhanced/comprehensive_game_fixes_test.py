@@ -5,31 +5,67 @@
 """
 
 import asyncio
+import contextlib
+import functools
+import io
+import pickle
 import sys
 import traceback
-from game_ui import GameUIStatic
-from game_engine.card_game import CardGame
+
+@functools.lru_cache(maxsize=1)
+def _proto_bytes():
+    """预先构建的游戏快照（首次使用时才导入游戏引擎并构建）"""
+    from game_engine.card_game import CardGame
+    return pickle.dumps(CardGame("测试玩家", "测试对手"))
+
+def _fresh_game():
+    """从快照恢复一个全新的、与其他测试不共享状态的游戏实例，避免重复执行构造和抽牌"""
+    return pickle.loads(_proto_bytes())
+
+# 测试输出缓冲 - 逐行记录，测试结束时一次性写出
+_report_lines = []
+
+def report(line=""):
+    """记录一行测试输出"""
+    _report_lines.append(line)
+
+def flush_report():
+    """将缓冲的测试输出一次性写到stdout"""
+    if _report_lines:
+        sys.stdout.write("\n".join(_report_lines) + "\n")
+        _report_lines.clear()
+
+def reported(test):
+    """测试装饰器：测试结束（包括异常）后写出缓冲的输出"""
+    @functools.wraps(test)
+    async def wrapper():
+        try:
+            return await test()
+        finally:
+            flush_report()
+    return wrapper
 
 def print_section(title):
-    """打印测试段落标题"""
-    print(f"\n{'='*60}")
-    print(f"🧪 {title}")
-    print('='*60)
+    """记录测试段落标题"""
+    report(f"\n{'='*60}")
+    report(f"🧪 {title}")
+    report('='*60)
 
 def print_test_result(test_name, success, details=""):
-    """打印测试结果"""
+    """记录测试结果"""
     status = "✅ 通过" if success else "❌ 失败"
-    print(f"{test_name}: {status}")
+    report(f"{test_name}: {status}")
     if details and not success:
-        print(f"   详情: {details}")
+        report(f"   详情: {details}")
 
+@reported
 async def test_get_winner_method():
     """测试get_winner方法是否正常工作"""
     print_section("测试 get_winner() 方法")
 
     try:
         # 创建游戏实例
-        game = CardGame("测试玩家", "测试对手")
+        game = _fresh_game()
 
         # 测试游戏未结束时的get_winner
         winner = game.get_winner()
@@ -53,12 +89,13 @@ async def test_get_winner_method():
         traceback.print_exc()
         return False
 
+@reported
 async def test_mana_system():
     """测试法力值系统"""
     print_section("测试法力值系统")
 
     try:
-        game = CardGame("测试玩家", "测试对手")
+        game = _fresh_game()
         player = game.players[0]
 
         # 测试初始法力值
@@ -91,6 +128,7 @@ async def test_mana_system():
         traceback.print_exc()
         return False
 
+@reported
 async def test_health_cleanup():
     """测试随从生命值清理机制"""
     print_section("测试随从生命值清理机制")
@@ -98,7 +136,7 @@ async def test_health_cleanup():
     try:
         from game_engine.card_game import Card
 
-        game = CardGame("测试玩家", "测试对手")
+        game = _fresh_game()
         player = game.players[0]
         opponent = game.players[1]
 
@@ -108,16 +146,16 @@ async def test_health_cleanup():
 
         player.field.extend([dying_minion, normal_minion])
 
-        print(f"清理前: 玩家场上有 {len(player.field)} 个随从")
+        report(f"清理前: 玩家场上有 {len(player.field)} 个随从")
         for i, minion in enumerate(player.field):
-            print(f"  {i}. {minion.name} ({minion.attack}/{minion.health})")
+            report(f"  {i}. {minion.name} ({minion.attack}/{minion.health})")
 
         # 执行死亡随从清理
         dead_minions = game._cleanup_dead_minions(player)
 
-        print(f"清理后: 玩家场上有 {len(player.field)} 个随从")
+        report(f"清理后: 玩家场上有 {len(player.field)} 个随从")
         for i, minion in enumerate(player.field):
-            print(f"  {i}. {minion.name} ({minion.attack}/{minion.health})")
+            report(f"  {i}. {minion.name} ({minion.attack}/{minion.health})")
 
         print_test_result("死亡随从清理", len(player.field) == 1 and len(dead_minions) == 1,
                         f"清理了 {len(dead_minions)} 个随从: {dead_minions}")
@@ -143,21 +181,24 @@ async def test_health_cleanup():
         traceback.print_exc()
         return False
 
+# 回合数增长测试中依次期望的回合数及其标签
+_EXPECTED_TURNS = tuple((turn, f"第{turn}回合") for turn in range(2, 7))
+
+@reported
 async def test_turn_number_display():
     """测试回合数显示"""
     print_section("测试回合数显示")
 
     try:
-        game = CardGame("测试玩家", "测试对手")
+        game = _fresh_game()
 
         # 测试初始回合数
         print_test_result("初始回合数", game.turn_number == 1, f"回合数: {game.turn_number}")
 
         # 测试回合数增长
-        for i in range(5):
+        for expected_turn, label in _EXPECTED_TURNS:
             game.start_turn()
-            expected_turn = i + 2
-            print_test_result(f"第{expected_turn}回合", game.turn_number == expected_turn,
+            print_test_result(label, game.turn_number == expected_turn,
                             f"期望: {expected_turn}, 实际: {game.turn_number}")
 
         # 测试游戏状态中的回合数
@@ -172,12 +213,13 @@ async def test_turn_number_display():
         traceback.print_exc()
         return False
 
+@reported
 async def test_game_over_detection():
     """测试游戏结束检测"""
     print_section("测试游戏结束检测")
 
     try:
-        game = CardGame("测试玩家", "测试对手")
+        game = _fresh_game()
 
         # 测试正常游戏结束（生命值归零）
         game.players[1].health = 0
@@ -187,7 +229,7 @@ async def test_game_over_detection():
                         f"游戏结束: {game_over}, 获胜者: {game.winner}")
 
         # 重置游戏状态
-        game = CardGame("测试玩家", "测试对手")
+        game = _fresh_game()
 
         # 测试平局（超过30回合）
         game.turn_number = 31
@@ -199,7 +241,7 @@ async def test_game_over_detection():
                         f"游戏结束: {game_over}, 获胜者: {game.winner}")
 
         # 测试平局时血量高者获胜
-        game = CardGame("测试玩家", "测试对手")
+        game = _fresh_game()
         game.turn_number = 31
         game.players[0].health = 25  # 玩家血量更高
         game.players[1].health = 15
@@ -215,6 +257,7 @@ async def test_game_over_detection():
         traceback.print_exc()
         return False
 
+@reported
 async def test_card_mechanics():
     """测试卡牌机制"""
     print_section("测试卡牌机制")
@@ -222,7 +265,7 @@ async def test_card_mechanics():
     try:
         from game_engine.card_game import Card
 
-        game = CardGame("测试玩家", "测试对手")
+        game = _fresh_game()
         player = game.players[0]
         opponent = game.players[1]
 
@@ -239,7 +282,7 @@ async def test_card_mechanics():
 
         print_test_result("神圣护盾机制", result["success"] and "divine_shield" not in divine_minion.mechanics,
                         f"法术结果: {result['message']}")
-        print(f"  圣盾随从生命值: {divine_minion.health}")
+        report(f"  圣盾随从生命值: {divine_minion.health}")
 
         # 测试嘲讽机制
         taunt_minion = Card("嘲讽随从", 2, 1, 5, "minion", ["taunt"])
@@ -261,13 +304,16 @@ async def test_card_mechanics():
         traceback.print_exc()
         return False
 
+@reported
 async def test_ui_integration():
     """测试UI集成"""
     print_section("测试UI集成")
 
     try:
+        from game_ui import GameUIStatic
+
         ui = GameUIStatic()
-        game = CardGame("测试玩家", "测试对手")
+        game = _fresh_game()
         ui.game_engine = game
 
         # 测试游戏状态更新
@@ -292,24 +338,46 @@ async def test_ui_integration():
         traceback.print_exc()
         return False
 
+async def _run_buffered(test, output_lock):
+    """运行单个测试，将其输出缓冲后在锁内一次性写出，避免并发输出交错
+
+    测试函数内部没有await点，因此重定向stdout期间不会切换到其他测试。
+    """
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        result = await test()
+    async with output_lock:
+        sys.stdout.write(buffer.getvalue())
+    return result
+
 async def main():
     """主测试函数"""
     print("🎮 卡牌战斗竞技场 - 综合修复验证测试")
     print("测试所有已修复的游戏机制问题")
 
-    test_results = []
-
-    # 运行所有测试
-    test_results.append(("get_winner()方法", await test_get_winner_method()))
-    test_results.append(("法力值系统", await test_mana_system()))
-    test_results.append(("随从生命值清理", await test_health_cleanup()))
-    test_results.append(("回合数显示", await test_turn_number_display()))
-    test_results.append(("游戏结束检测", await test_game_over_detection()))
-    test_results.append(("卡牌机制", await test_card_mechanics()))
-    test_results.append(("UI集成", await test_ui_integration()))
+    tests = [
+        ("get_winner()方法", test_get_winner_method),
+        ("法力值系统", test_mana_system),
+        ("随从生命值清理", test_health_cleanup),
+        ("回合数显示", test_turn_number_display),
+        ("游戏结束检测", test_game_over_detection),
+        ("卡牌机制", test_card_mechanics),
+        ("UI集成", test_ui_integration),
+    ]
+
+    # 并发运行所有测试 - 每个测试使用独立的CardGame实例，互不共享状态
+    output_lock = asyncio.Lock()
+    results = await asyncio.gather(
+        *(_run_buffered(test, output_lock) for _, test in tests),
+        return_exceptions=True
+    )
+    test_results = [
+        (name, result is True) for (name, _), result in zip(tests, results)
+    ]
 
     # 显示测试总结
     print_section("测试结果总结")
+    flush_report()
 
     passed_count = 0
     total_count = len(test_results)
@@ -3,16 +3,26 @@
 支持环境变量和配置文件的加载
 """
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
+from compat import DATACLASS_OPTIONS
+
 # 加载环境变量
 load_dotenv()
 
+# 有效的AI策略和人格
+VALID_STRATEGIES = frozenset(("rule_based", "hybrid", "llm_enhanced"))
+VALID_PERSONALITIES = frozenset((
+    "aggressive_berserker", "wise_defender", "strategic_mastermind",
+    "combo_enthusiast", "adaptive_learner", "fun_seeker"
+))
+
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class AISettings:
     """AI配置"""
     default_strategy: str = "hybrid"
@@ -33,7 +43,7 @@ class AISettings:
     claude_model: str = "claude-3-haiku-20240307"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class GameSettings:
     """游戏配置"""
     mode: str = "demo"
@@ -48,7 +58,7 @@ class GameSettings:
     show_performance: bool = True
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class MonitoringSettings:
     """监控配置"""
     enable_monitoring: bool = True
@@ -57,7 +67,7 @@ class MonitoringSettings:
     metrics_file: str = "performance_metrics.json"
 
 
-@dataclass
+@dataclass(**DATACLASS_OPTIONS)
 class Settings:
     """完整配置"""
     ai: AISettings
@@ -65,6 +75,61 @@ class Settings:
     monitoring: MonitoringSettings
 
 
+_TRUE_VALUES = frozenset(("1", "true", "yes", "on"))
+
+
+def _as_bool(value: Optional[str]) -> bool:
+    """将环境变量值解析为布尔值"""
+    return value.lower() in _TRUE_VALUES if value else False
+
+
+# 环境变量加载表: (字段名, 环境变量名, 默认值, 类型转换函数)
+# 转换函数为None时保留原始值（用于可选的API密钥）
+_AI_FIELDS = (
+    ("default_strategy", "DEFAULT_AI_STRATEGY", "hybrid", str),
+    ("default_personality", "DEFAULT_PERSONALITY", "adaptive_learner", str),
+    ("enable_llm", "ENABLE_LLM", "true", _as_bool),
+    ("max_decision_time", "MAX_DECISION_TIME", "20.0", float),
+
+    ("deepseek_api_key", "DEEPSEEK_API_KEY", None, None),
+    ("deepseek_model", "DEEPSEEK_MODEL", "deepseek-chat", str),
+
+    ("openai_api_key", "OPENAI_API_KEY", None, None),
+    ("openai_model", "OPENAI_MODEL", "gpt-3.5-turbo", str),
+
+    ("claude_api_key", "ANTHROPIC_API_KEY", None, None),
+    ("claude_model", "CLAUDE_MODEL", "claude-3-haiku-20240307", str),
+)
+
+_GAME_FIELDS = (
+    ("mode", "GAME_MODE", "demo", str),
+    ("difficulty", "GAME_DIFFICULTY", "normal", str),
+    ("games", "GAME_COUNT", "1", int),
+    ("quiet", "QUIET", "false", _as_bool),
+    ("verbose", "VERBOSE", "false", _as_bool),
+
+    ("show_thinking", "SHOW_THINKING", "true", _as_bool),
+    ("show_emotions", "SHOW_EMOTIONS", "true", _as_bool),
+    ("show_performance", "SHOW_PERFORMANCE", "true", _as_bool),
+)
+
+_MONITORING_FIELDS = (
+    ("enable_monitoring", "ENABLE_MONITORING", "true", _as_bool),
+    ("log_level", "LOG_LEVEL", "INFO", str),
+    ("export_metrics", "EXPORT_METRICS", "false", _as_bool),
+    ("metrics_file", "METRICS_FILE", "performance_metrics.json", str),
+)
+
+
+def _load_fields(settings_cls, fields, env):
+    """按加载表从环境变量快照构建配置对象"""
+    kwargs = {}
+    for name, key, default, cast in fields:
+        value = env.get(key, default)
+        kwargs[name] = value if cast is None else cast(value)
+    return settings_cls(**kwargs)
+
+
 class SettingsManager:
     """配置管理器"""
 
@@ -74,53 +139,25 @@ class SettingsManager:
     def load_settings(self) -> Settings:
         """加载配置"""
         if self._settings is None:
+            env = os.environ
             self._settings = Settings(
-                ai=self._load_ai_settings(),
-                game=self._load_game_settings(),
-                monitoring=self._load_monitoring_settings()
+                ai=self._load_ai_settings(env),
+                game=self._load_game_settings(env),
+                monitoring=self._load_monitoring_settings(env)
             )
         return self._settings
 
-    def _load_ai_settings(self) -> AISettings:
+    def _load_ai_settings(self, env: Mapping[str, str]) -> AISettings:
         """加载AI配置"""
-        return AISettings(
-            default_strategy=os.getenv("DEFAULT_AI_STRATEGY", "hybrid"),
-            default_personality=os.getenv("DEFAULT_PERSONALITY", "adaptive_learner"),
-            enable_llm=os.getenv("ENABLE_LLM", "true").lower() == "true",
-            max_decision_time=float(os.getenv("MAX_DECISION_TIME", "20.0")),
+        return _load_fields(AISettings, _AI_FIELDS, env)
 
-            deepseek_api_key=os.getenv("DEEPSEEK_API_KEY"),
-            deepseek_model=os.getenv("DEEPSEEK_MODEL", "deepseek-chat"),
-
-            openai_api_key=os.getenv("OPENAI_API_KEY"),
-            openai_model=os.getenv("OPENAI_MODEL", "gpt-3.5-turbo"),
-
-            claude_api_key=os.getenv("ANTHROPIC_API_KEY"),
-            claude_model=os.getenv("CLAUDE_MODEL", "claude-3-haiku-20240307")
-        )
-
-    def _load_game_settings(self) -> GameSettings:
+    def _load_game_settings(self, env: Mapping[str, str]) -> GameSettings:
         """加载游戏配置"""
-        return GameSettings(
-            mode=os.getenv("GAME_MODE", "demo"),
-            difficulty=os.getenv("GAME_DIFFICULTY", "normal"),
-            games=int(os.getenv("GAME_COUNT", "1")),
-            quiet=os.getenv("QUIET", "false").lower() == "true",
-            verbose=os.getenv("VERBOSE", "false").lower() == "true",
-
-            show_thinking=os.getenv("SHOW_THINKING", "true").lower() == "true",
-            show_emotions=os.getenv("SHOW_EMOTIONS", "true").lower() == "true",
-            show_performance=os.getenv("SHOW_PERFORMANCE", "true").lower() == "true"
-        )
-
-    def _load_monitoring_settings(self) -> MonitoringSettings:
+        return _load_fields(GameSettings, _GAME_FIELDS, env)
+
+    def _load_monitoring_settings(self, env: Mapping[str, str]) -> MonitoringSettings:
         """加载监控配置"""
-        return MonitoringSettings(
-            enable_monitoring=os.getenv("ENABLE_MONITORING", "true").lower() == "true",
-            log_level=os.getenv("LOG_LEVEL", "INFO"),
-            export_metrics=os.getenv("EXPORT_METRICS", "false").lower() == "true",
-            metrics_file=os.getenv("METRICS_FILE", "performance_metrics.json")
-        )
+        return _load_fields(MonitoringSettings, _MONITORING_FIELDS, env)
 
     def validate_settings(self, settings: Settings) -> bool:
         """验证配置有效性"""
@@ -130,16 +167,11 @@ class SettingsManager:
             settings.ai.enable_llm = False
 
         # 检查策略和人格的有效性
-        valid_strategies = ["rule_based", "hybrid", "llm_enhanced"]
-        if settings.ai.default_strategy not in valid_strategies:
+        if settings.ai.default_strategy not in VALID_STRATEGIES:
             print(f"⚠️  无效的策略: {settings.ai.default_strategy}，使用默认策略")
             settings.ai.default_strategy = "hybrid"
 
-        valid_personalities = [
-            "aggressive_berserker", "wise_defender", "strategic_mastermind",
-            "combo_enthusiast", "adaptive_learner", "fun_seeker"
-        ]
-        if settings.ai.default_personality not in valid_personalities:
+        if settings.ai.default_personality not in VALID_PERSONALITIES:
             print(f"⚠️  无效的人格: {settings.ai.default_personality}，使用默认人格")
             settings.ai.default_personality = "adaptive_learner"
 
@@ -150,26 +182,38 @@ class SettingsManager:
         return Path(__file__).parent.parent / ".env"
 
     def create_env_file(self):
-        """创建环境变量文件"""
+        """创建环境变量文件（已存在时不做任何操作）"""
+        import shutil
+
         env_file = self.get_env_file_path()
-        if not env_file.exists():
-            example_file = env_file.with_suffix(".example")
-            if example_file.exists():
-                import shutil
-                shutil.copy(example_file, env_file)
-                print(f"✅ 已创建环境变量文件: {env_file}")
-                print("请编辑 .env 文件并填入你的API密钥")
-            else:
-                print("⚠️  找不到环境变量示例文件")
+        example_file = env_file.with_suffix(".example")
+        try:
+            # 'x' 模式仅在文件不存在时创建，省去额外的 exists() 检查；
+            # 先创建目标文件，已存在时不再读取示例文件
+            dst = open(env_file, 'xb')
+        except FileExistsError:
+            return
+        try:
+            with dst, open(example_file, 'rb') as src:
+                shutil.copyfileobj(src, dst)
+        except FileNotFoundError:
+            # 不留下空的 .env 文件，示例文件补上后可以重新创建
+            env_file.unlink()
+            print("⚠️  找不到环境变量示例文件")
+            return
+
+        print(f"✅ 已创建环境变量文件: {env_file}")
+        print("请编辑 .env 文件并填入你的API密钥")
 
 
 # 全局配置管理器实例
 settings_manager = SettingsManager()
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """获取配置"""
-    return settings_manager.load_settings()
+    """获取配置（测试中可通过 get_settings.cache_clear() 重置，下次调用重新读取环境变量）"""
+    return SettingsManager().load_settings()
 
 
 def setup_environment():
@@ -178,7 +222,6 @@ def setup_environment():
     settings_manager.validate_settings(settings)
 
     # 如果没有.env文件，创建一个
-    if not settings_manager.get_env_file_path().exists():
-        settings_manager.create_env_file()
+    settings_manager.create_env_file()
 
     return settings
\ No newline at end of file
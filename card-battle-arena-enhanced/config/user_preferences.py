@@ -3,11 +3,48 @@
 提供游戏用户界面的个性化配置
 """
 import json
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
-from dataclasses import dataclass, field, asdict
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Callable, Tuple
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
+from compat import DATACLASS_OPTIONS
+from .settings import VALID_STRATEGIES, VALID_PERSONALITIES
+
+# 可选依赖：orjson 可用时用于偏好设置的快速序列化
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """序列化为带缩进的UTF-8编码JSON字节"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+
+
+def _loads(raw: bytes) -> Any:
+    """从JSON字节反序列化"""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+# 默认配置目录
+_DEFAULT_CONFIG_DIR = Path.home() / ".card_battle_arena"
+
+
+@lru_cache(maxsize=1)
+def _default_config_dir() -> Path:
+    """返回默认配置目录，首次调用时创建（每个进程只创建一次）"""
+    _DEFAULT_CONFIG_DIR.mkdir(exist_ok=True)
+    return _DEFAULT_CONFIG_DIR
+
 
 class DisplayMode(Enum):
     """显示模式"""
@@ -33,7 +70,26 @@ class Language(Enum):
     JA_JP = "ja_JP"
 
 
-@dataclass
+# 默认快捷键（键名驻留，查找时可直接按指针比较）
+_QUICK_ACTION_KEYS = tuple(sys.intern(k) for k in (
+    "help", "quit", "end_turn", "play_card", "use_skill", "settings"
+))
+_DEFAULT_QUICK_ACTIONS = MappingProxyType(dict(zip(
+    _QUICK_ACTION_KEYS, ("h", "q", "enter", "p", "s", "esc")
+)))
+
+# 设置项不存在时的哨兵值
+_MISSING = object()
+
+# 需要在序列化时转换的枚举字段
+_ENUM_FIELDS = {
+    "display_mode": DisplayMode,
+    "theme": Theme,
+    "language": Language,
+}
+
+
+@dataclass(**DATACLASS_OPTIONS)
 class UserPreferences:
     """用户偏好设置"""
 
@@ -58,54 +114,59 @@ class UserPreferences:
     font_size: int = 12
 
     # 快捷键设置
-    quick_actions: Dict[str, str] = field(default_factory=lambda: {
-        "help": "h",
-        "quit": "q",
-        "end_turn": "enter",
-        "play_card": "p",
-        "use_skill": "s",
-        "settings": "esc"
-    })
+    quick_actions: Dict[str, str] = field(default_factory=lambda: dict(_DEFAULT_QUICK_ACTIONS))
 
     def to_dict(self) -> Dict[str, Any]:
-        """转换为字典格式"""
-        data = asdict(self)
-
-        # 处理枚举类型
-        data["display_mode"] = self.display_mode.value
-        data["theme"] = self.theme.value
-        data["language"] = self.language.value
-
-        return data
+        """转换为字典格式（字段均为简单类型，直接构建以避免 asdict 的递归深拷贝）"""
+        return {
+            # 显示设置
+            "animation_enabled": self.animation_enabled,
+            "sound_enabled": self.sound_enabled,
+            "display_mode": self.display_mode.value,
+            "theme": self.theme.value,
+            "language": self.language.value,
+
+            # 游戏体验设置
+            "auto_save": self.auto_save,
+            "show_tips": self.show_tips,
+            "show_ai_thinking": self.show_ai_thinking,
+            "show_performance_metrics": self.show_performance_metrics,
+            "confirm_before_quit": self.confirm_before_quit,
+
+            # 界面设置
+            "console_width": self.console_width,
+            "color_scheme": self.color_scheme,
+            "show_line_numbers": self.show_line_numbers,
+            "font_size": self.font_size,
+
+            # 快捷键设置
+            "quick_actions": dict(self.quick_actions),
+        }
 
     def from_dict(self, data: Dict[str, Any]):
         """从字典恢复设置"""
         for key, value in data.items():
-            if hasattr(self, key):
+            if key in _PREFERENCE_FIELDS:
                 # 处理枚举类型
-                if key == "display_mode":
-                    self.display_mode = DisplayMode(value)
-                elif key == "theme":
-                    self.theme = Theme(value)
-                elif key == "language":
-                    self.language = Language(value)
-                else:
-                    setattr(self, key, value)
+                enum_cls = _ENUM_FIELDS.get(key)
+                if enum_cls:
+                    value = enum_cls(value)
+                elif key == "quick_actions" and isinstance(value, dict):
+                    # 驻留从文件读取的快捷键名
+                    value = {sys.intern(k): v for k, v in value.items()}
+                setattr(self, key, value)
 
     def save_to_file(self, file_path: Path):
         """保存到文件"""
-        data = self.to_dict()
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        file_path.write_bytes(_dumps(self.to_dict()))
 
     def load_from_file(self, file_path: Path):
         """从文件加载"""
-        if file_path.exists():
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.from_dict(data)
-        else:
-            raise FileNotFoundError(f"设置文件不存在: {file_path}")
+        try:
+            raw = file_path.read_bytes()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"设置文件不存在: {file_path}") from None
+        self.from_dict(_loads(raw))
 
     def get_display_settings_summary(self) -> str:
         """获取显示设置的摘要信息"""
@@ -132,9 +193,15 @@ class UserPreferences:
         return errors
 
 
+# UserPreferences 的字段名，from_dict 只接受这些键
+_PREFERENCE_FIELDS = frozenset(f.name for f in fields(UserPreferences))
+
+
 class SettingsChangeEvent:
     """设置变更事件"""
 
+    __slots__ = ("category", "key", "old_value", "new_value", "timestamp")
+
     def __init__(self, category: str, key: str, old_value: Any, new_value: Any):
         self.category = category
         self.key = key
@@ -151,22 +218,34 @@ class SettingsManager:
 
         # 配置目录
         if config_dir is None:
-            self.config_dir = Path.home() / ".card_battle_arena"
+            self.config_dir = _default_config_dir()
         else:
             self.config_dir = config_dir
-
-        self.config_dir.mkdir(exist_ok=True)
+            self.config_dir.mkdir(exist_ok=True)
 
         # 加载各种设置
         self.user_preferences = UserPreferences()
         self.game_settings = get_settings()
+        self._index_game_fields()
 
         # 设置文件路径
         self.prefs_file = self.config_dir / "user_preferences.json"
         self.game_config_file = self.config_dir / "game_config.json"
 
-        # 变更回调函数列表
-        self._change_callbacks: List[Callable[[SettingsChangeEvent], None]] = []
+        # 变更回调函数（注册时重建为元组，通知时直接遍历）
+        self._change_callbacks: Tuple[Callable[[SettingsChangeEvent], None], ...] = ()
+
+        # 设置分类 -> 读取/写入函数（写入函数返回旧值，键不存在时返回 _MISSING）
+        self._getters: Dict[str, Callable[[str], Any]] = {
+            "display": self._get_display_setting,
+            "game": self._get_game_setting,
+            "quick_actions": self._get_quick_action,
+        }
+        self._setters: Dict[str, Callable[[str, Any], Any]] = {
+            "display": self._set_display_setting,
+            "game": self._set_game_setting,
+            "quick_actions": self._set_quick_action,
+        }
 
         # 加载已保存的设置
         self.load_all_settings()
@@ -175,8 +254,10 @@ class SettingsManager:
         """加载所有设置"""
         try:
             # 加载用户偏好
-            if self.prefs_file.exists():
-                self.user_preferences.load_from_file(self.prefs_file)
+            self.user_preferences.load_from_file(self.prefs_file)
+        except FileNotFoundError:
+            # 首次运行时还没有保存过偏好设置
+            pass
         except Exception as e:
             print(f"⚠️  加载用户偏好失败: {e}")
 
@@ -194,38 +275,19 @@ class SettingsManager:
 
     def update_setting(self, category: str, key: str, value: Any) -> bool:
         """更新设置"""
-        old_value = None
-        updated = False
-
         try:
-            if category == "display":
-                if hasattr(self.user_preferences, key):
-                    old_value = getattr(self.user_preferences, key)
-                    setattr(self.user_preferences, key, value)
-                    updated = True
-
-            elif category == "game":
-                if hasattr(self.game_settings.game, key):
-                    old_value = getattr(self.game_settings.game, key)
-                    setattr(self.game_settings.game, key, value)
-                    updated = True
-                elif hasattr(self.game_settings.ai, key):
-                    old_value = getattr(self.game_settings.ai, key)
-                    setattr(self.game_settings.ai, key, value)
-                    updated = True
-
-            elif category == "quick_actions":
-                if key in self.user_preferences.quick_actions:
-                    old_value = self.user_preferences.quick_actions[key]
-                    self.user_preferences.quick_actions[key] = value
-                    updated = True
-
-            # 如果更新成功，触发变更事件
-            if updated:
-                event = SettingsChangeEvent(category, key, old_value, value)
-                self._notify_change(event)
-
-            return updated
+            setter = self._setters.get(category)
+            if setter is None:
+                return False
+
+            old_value = setter(key, value)
+            if old_value is _MISSING:
+                return False
+
+            # 更新成功，触发变更事件
+            event = SettingsChangeEvent(category, key, old_value, value)
+            self._notify_change(event)
+            return True
 
         except Exception as e:
             print(f"⚠️  更新设置失败: {e}")
@@ -233,20 +295,59 @@ class SettingsManager:
 
     def get_setting(self, category: str, key: str) -> Any:
         """获取设置值"""
-        try:
-            if category == "display":
-                return getattr(self.user_preferences, key)
-            elif category == "game":
-                if hasattr(self.game_settings.game, key):
-                    return getattr(self.game_settings.game, key)
-                elif hasattr(self.game_settings.ai, key):
-                    return getattr(self.game_settings.ai, key)
-            elif category == "quick_actions":
-                return self.user_preferences.quick_actions.get(key)
-        except AttributeError:
-            return None
-
-        return None
+        getter = self._getters.get(category)
+        return getter(key) if getter is not None else None
+
+    def _game_setting_owner(self, key: str) -> Any:
+        """返回包含该键的游戏配置对象"""
+        return self._game_field_owner.get(key)
+
+    def _index_game_fields(self):
+        """建立 字段名 -> 所属配置对象 的索引（game_settings 替换后需重建）"""
+        self._game_field_owner: Dict[str, Any] = {}
+        for owner_name in ("game", "ai", "monitoring"):
+            owner = getattr(self.game_settings, owner_name)
+            for f in fields(owner):
+                self._game_field_owner.setdefault(f.name, owner)
+
+    def _get_display_setting(self, key: str) -> Any:
+        """读取显示设置"""
+        return getattr(self.user_preferences, key, None)
+
+    def _get_game_setting(self, key: str) -> Any:
+        """读取游戏/AI设置"""
+        owner = self._game_setting_owner(key)
+        return getattr(owner, key) if owner is not None else None
+
+    def _get_quick_action(self, key: str) -> Any:
+        """读取快捷键设置"""
+        return self.user_preferences.quick_actions.get(key)
+
+    def _set_display_setting(self, key: str, value: Any) -> Any:
+        """写入显示设置，返回旧值"""
+        if not hasattr(self.user_preferences, key):
+            return _MISSING
+        old_value = getattr(self.user_preferences, key)
+        setattr(self.user_preferences, key, value)
+        return old_value
+
+    def _set_game_setting(self, key: str, value: Any) -> Any:
+        """写入游戏/AI设置，返回旧值"""
+        owner = self._game_setting_owner(key)
+        if owner is None:
+            return _MISSING
+        old_value = getattr(owner, key)
+        setattr(owner, key, value)
+        return old_value
+
+    def _set_quick_action(self, key: str, value: Any) -> Any:
+        """写入快捷键设置，返回旧值"""
+        quick_actions = self.user_preferences.quick_actions
+        if key not in quick_actions:
+            return _MISSING
+        old_value = quick_actions[key]
+        quick_actions[key] = value
+        return old_value
 
     def reset_to_defaults(self):
         """重置为默认设置"""
@@ -257,6 +358,7 @@ class SettingsManager:
         # 重置游戏设置
         from .settings import get_settings
         self.game_settings = get_settings()
+        self._index_game_fields()
 
         # 通知变更
         event = SettingsChangeEvent("system", "reset", old_prefs, self.user_preferences)
@@ -330,15 +432,10 @@ class SettingsManager:
 
         # 验证游戏设置
         try:
-            valid_strategies = ["rule_based", "hybrid", "llm_enhanced"]
-            if self.game_settings.ai.default_strategy not in valid_strategies:
+            if self.game_settings.ai.default_strategy not in VALID_STRATEGIES:
                 return False
 
-            valid_personalities = [
-                "aggressive_berserker", "wise_defender", "strategic_mastermind",
-                "combo_enthusiast", "adaptive_learner", "fun_seeker"
-            ]
-            if self.game_settings.ai.default_personality not in valid_personalities:
+            if self.game_settings.ai.default_personality not in VALID_PERSONALITIES:
                 return False
 
         except Exception:
@@ -356,37 +453,30 @@ class SettingsManager:
             self.user_preferences.font_size = 12
 
         # 修复游戏设置
-        valid_strategies = ["rule_based", "hybrid", "llm_enhanced"]
-        if self.game_settings.ai.default_strategy not in valid_strategies:
+        if self.game_settings.ai.default_strategy not in VALID_STRATEGIES:
             self.game_settings.ai.default_strategy = "hybrid"
 
-        valid_personalities = [
-            "aggressive_berserker", "wise_defender", "strategic_mastermind",
-            "combo_enthusiast", "adaptive_learner", "fun_seeker"
-        ]
-        if self.game_settings.ai.default_personality not in valid_personalities:
+        if self.game_settings.ai.default_personality not in VALID_PERSONALITIES:
             self.game_settings.ai.default_personality = "adaptive_learner"
 
     def register_change_callback(self, callback: Callable[[SettingsChangeEvent], None]):
         """注册设置变更回调函数"""
-        self._change_callbacks.append(callback)
+        self._change_callbacks = self._change_callbacks + (callback,)
 
     def _notify_change(self, event: SettingsChangeEvent):
         """通知设置变更"""
-        for callback in self._change_callbacks:
+        callbacks = self._change_callbacks
+        if not callbacks:
+            return
+
+        for callback in callbacks:
             try:
                 callback(event)
             except Exception as e:
                 print(f"⚠️  设置变更回调执行失败: {e}")
 
 
-# 全局设置管理器实例
-_settings_manager: Optional[SettingsManager] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings_manager() -> SettingsManager:
-    """获取全局设置管理器实例"""
-    global _settings_manager
-    if _settings_manager is None:
-        _settings_manager = SettingsManager()
-    return _settings_manager
\ No newline at end of file
+    """获取全局设置管理器实例（测试中可通过 get_settings_manager.cache_clear() 重置）"""
+    return SettingsManager()
@@ -9,7 +9,7 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from game_engine.card_game import CardGame, Card
+from game_engine.card_game import CardGame, Card, parse_minion_target
 
 def debug_ai_attack_target_issue():
     """调试AI攻击执行失败问题"""
@@ -77,21 +77,18 @@ def debug_ai_attack_target_issue():
                 console.print("\n🔍 [yellow]验证攻击目标有效性[/yellow]")
 
                 # 检查目标是否匹配英雄
+                minion_index = parse_minion_target(target)
                 if target == "英雄":
                     console.print("✅ 目标是英雄，应该有效")
-                elif target.startswith("随从_"):
-                    # 提取随从索引
-                    try:
-                        minion_index = int(target.split("_")[1])
-                        console.print(f"📝 解析随从索引: {minion_index}")
-
-                        if 0 <= minion_index < len(player.field):
-                            target_minion = player.field[minion_index]
-                            console.print(f"✅ 找到目标随从: {target_minion.name}")
-                        else:
-                            console.print(f"❌ 随从索引 {minion_index} 超出范围 (0-{len(player.field)-1})")
-                    except (ValueError, IndexError):
-                        console.print(f"❌ 无法解析随从索引: {target}")
+                elif minion_index is not None:
+                    console.print(f"📝 解析随从索引: {minion_index}")
+
+                    field_size = len(player.field)
+                    if 0 <= minion_index < field_size:
+                        target_minion = player.field[minion_index]
+                        console.print(f"✅ 找到目标随从: {target_minion.name}")
+                    else:
+                        console.print(f"❌ 随从索引 {minion_index} 超出范围 (0-{field_size-1})")
                 else:
                     console.print(f"❌ 未知的目标格式: {target}")
 
@@ -101,19 +98,16 @@ def debug_ai_attack_target_issue():
                 console.print(f"攻击者类型: {type(attacker)}")
 
                 # 检查攻击者是否有效
-                if attacker.startswith("随从_"):
-                    try:
-                        attacker_index = int(attacker.split("_")[1])
-                        console.print(f"📝 解析攻击者索引: {attacker_index}")
-
-                        if 0 <= attacker_index < len(ai_player.field):
-                            attacker_minion = ai_player.field[attacker_index]
-                            console.print(f"✅ 找到攻击随从: {attacker_minion.name}")
-                            console.print(f"   攻击力: {attacker_minion.attack}, 可攻击: {attacker_minion.can_attack}")
-                        else:
-                            console.print(f"❌ 攻击者索引 {attacker_index} 超出范围")
-                    except (ValueError, IndexError):
-                        console.print(f"❌ 无法解析攻击者索引: {attacker}")
+                attacker_index = parse_minion_target(attacker)
+                if attacker_index is not None:
+                    console.print(f"📝 解析攻击者索引: {attacker_index}")
+
+                    if 0 <= attacker_index < len(ai_player.field):
+                        attacker_minion = ai_player.field[attacker_index]
+                        console.print(f"✅ 找到攻击随从: {attacker_minion.name}")
+                        console.print(f"   攻击力: {attacker_minion.attack}, 可攻击: {attacker_minion.can_attack}")
+                    else:
+                        console.print(f"❌ 攻击者索引 {attacker_index} 超出范围")
                 else:
                     console.print(f"❌ 未知的攻击者格式: {attacker}")
         else:
@@ -5,6 +5,7 @@
 import sys
 from pathlib import Path
 import asyncio
+import time
 import logging
 
 # 添加项目根目录到Python路径
@@ -17,8 +18,8 @@ from ai_engine.strategies.hybrid import HybridAIStrategy
 from ai_engine.agents.agent_personality import PersonalityProfile, PersonalityTrait, PlayStyle
 from rich.console import Console
 
-# 设置日志级别
-logging.basicConfig(level=logging.DEBUG)
+# 设置日志级别 - INFO足以看到混合AI的决策步骤，DEBUG会让第三方库的日志淹没输出并拖慢计时
+logging.basicConfig(level=logging.DEBUG if "--verbose" in sys.argv else logging.INFO)
 logger = logging.getLogger(__name__)
 
 console = Console()
@@ -72,9 +73,7 @@ async def test_ai_decision():
         Card("治疗术", 2, -5, 0, "spell", [], "恢复5点生命")
     ]
     
-    game.players[1].hand.clear()
-    for card in ai_cards:
-        game.players[1].hand.append(card)
+    game.players[1].hand[:] = ai_cards
     
     # 设置足够的法力值
     game.players[1].mana = 10
@@ -86,14 +85,13 @@ async def test_ai_decision():
     
     # 让AI进行决策
     console.print(f"\n🤖 [bold magenta]AI开始决策...[/bold magenta]")
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.perf_counter()
     
     try:
         # 使用AI代理的决策方法
         action = ai_agent.decide_action(game.players[1], game)
         
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         
         if action:
             console.print(f"✅ [bold green]AI决策完成！[/bold green]")
@@ -106,8 +104,7 @@ async def test_ai_decision():
             console.print(f"   耗时: {elapsed_time:.2f}秒")
             
     except Exception as e:
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         console.print(f"💥 [bold red]AI决策出错: {e}[/bold red]")
         console.print(f"   耗时: {elapsed_time:.2f}秒")
         import traceback
@@ -3,7 +3,7 @@
 直接调用规则AI策略的调试脚本
 """
 
-import asyncio
+import time
 import sys
 import os
 import logging
@@ -111,7 +111,7 @@ def test_rule_based_strategy_direct():
     
     # 测试AI决策
     console.print(f"\n[bold magenta]规则AI开始决策...[/bold magenta]")
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.perf_counter()
     
     try:
         # 直接调用决策方法（不使用async）
@@ -137,14 +137,12 @@ def test_rule_based_strategy_direct():
         else:
             console.print(f"  - 无英雄技能动作")
         
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         console.print(f"[bold green]✅ 规则AI评估完成！[/bold green]")
         console.print(f"  耗时: {elapsed_time:.2f}秒")
             
     except Exception as e:
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         console.print(f"[bold red]💥 规则AI评估出错: {e}[/bold red]")
         console.print(f"  耗时: {elapsed_time:.2f}秒")
         import traceback
@@ -4,7 +4,15 @@
 """
 
 import sys
-import traceback
+
+# 只导入一次Rich并复用同一个Console，导入失败时记录错误供main()报告
+try:
+    from rich.console import Console
+    _CONSOLE = Console()
+    _RICH_ERROR = None
+except Exception as e:
+    _CONSOLE = None
+    _RICH_ERROR = e
 
 def main():
     try:
@@ -12,26 +20,26 @@ def main():
         sys.stdout.flush()
         
         # 测试导入
-        try:
-            import rich
+        if _RICH_ERROR is None:
             print("Rich imported successfully")
             sys.stdout.flush()
-        except ImportError as e:
-            print(f"Rich import error: {e}")
+        else:
+            print(f"Rich import error: {_RICH_ERROR}")
             sys.stdout.flush()
+            return
         
         # 测试基本功能
         try:
-            from rich.console import Console
-            console = Console()
-            console.print("[green]Rich console works![/green]")
+            _CONSOLE.print("[green]Rich console works![/green]")
         except Exception as e:
             print(f"Rich console error: {e}")
+            import traceback
             traceback.print_exc()
             sys.stdout.flush()
             
     except Exception as e:
         print(f"Main error: {e}")
+        import traceback
         traceback.print_exc()
         sys.stdout.flush()
 
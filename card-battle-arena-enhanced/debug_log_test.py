@@ -7,7 +7,7 @@ import sys
 import logging
 import os
 
-# 配置日志
+# 配置日志 - 使用同步处理器，日志与print输出按调用顺序写出，便于对照
 logging.basicConfig(
     level=logging.DEBUG,
     format='%(asctime)s - %(levelname)s - %(message)s',
@@ -39,9 +39,7 @@ def main():
         logger.info("All tests completed")
         
     except Exception as e:
-        logger.error(f"Error occurred: {e}")
-        import traceback
-        logger.error(traceback.format_exc())
+        logger.exception("Error occurred: %s", e)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -9,12 +9,14 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from game_engine.card_game import CardGame, Card
+from game_engine.card_game import CardGame, Card, get_minion_can_attack
+from rich.console import Console
+
+_CONSOLE = Console()
 
 def debug_minion_attack():
     """调试随从攻击问题"""
-    from rich.console import Console
-    console = Console()
+    console = _CONSOLE
 
     console.print("🔍 [bold blue]调试随从攻击选项[/bold blue]")
     console.print("=" * 50)
@@ -52,7 +54,6 @@ def debug_minion_attack():
         console.print(f"   设置可攻击: {minion.name} (can_attack={minion.can_attack})")
 
         # 检查攻击逻辑
-        from game_engine.card_game import get_minion_can_attack
         can_attack = get_minion_can_attack(minion, False)
         console.print(f"   检查可攻击: {can_attack}")
 
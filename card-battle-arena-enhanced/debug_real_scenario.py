@@ -10,11 +10,35 @@ project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from game_engine.card_game import CardGame, Card
+from rich.console import Console
+
+_CONSOLE = Console()
+
+
+def _report_scenario(console, game, player, show_attackable: bool = True):
+    """输出当前场景的手牌/随从统计和底部提示"""
+    hand_size, field_size = len(player.hand), len(player.field)
+    playable = sum(1 for c in player.hand if c.cost <= player.mana)
+    lines = [f"手牌数量: {hand_size} (可出牌: {playable})"]
+    if show_attackable:
+        attackable = sum(1 for m in player.field if m.can_attack)
+        lines.append(f"场上随从: {field_size} (可攻击: {attackable})")
+    else:
+        lines.append(f"场上随从: {field_size}")
+
+    hints = game.get_simple_input_hints()
+    lines.append(f"底部提示: {hints}")
+    has_attack_hint = "攻击" in hints  # 修复检测逻辑
+    lines.append(f"攻击提示显示: {'✅ 是' if has_attack_hint else '❌ 否'}")
+    lines.append("\n" + "-"*50 + "\n")
+
+    # 整个场景的输出一次性交给Rich渲染
+    console.print("\n".join(lines))
+
 
 def debug_real_scenario():
     """调试真实游戏场景中的随从攻击选项显示"""
-    from rich.console import Console
-    console = Console()
+    console = _CONSOLE
 
     console.print("🎯 [bold blue]真实场景调试 - 随从攻击选项显示[/bold blue]")
     console.print("=" * 50)
@@ -35,44 +59,20 @@ def debug_real_scenario():
     minion.can_attack = True
     player.field.append(minion)
 
-    console.print(f"手牌数量: {len(player.hand)} (可出牌: {len([c for c in player.hand if c.cost <= player.mana])})")
-    console.print(f"场上随从: {len(player.field)} (可攻击: {len([m for m in player.field if getattr(m, 'can_attack', False)])})")
-
-    hints = game.get_simple_input_hints()
-    console.print(f"底部提示: {hints}")
-    has_attack_hint = "攻击" in hints  # 修复检测逻辑
-    console.print(f"攻击提示显示: {'✅ 是' if has_attack_hint else '❌ 否'}")
-
-    console.print("\n" + "-"*50 + "\n")
+    _report_scenario(console, game, player)
 
     # 场景2: 手中无牌 + 场上有可攻击随从
     console.print("📋 [bold cyan]场景2: 手中无牌 + 场上有可攻击随从[/bold cyan]")
     player.hand.clear()  # 清空手牌
 
-    console.print(f"手牌数量: {len(player.hand)} (可出牌: {len([c for c in player.hand if c.cost <= player.mana])})")
-    console.print(f"场上随从: {len(player.field)} (可攻击: {len([m for m in player.field if getattr(m, 'can_attack', False)])})")
-
-    hints = game.get_simple_input_hints()
-    console.print(f"底部提示: {hints}")
-    has_attack_hint = "攻击" in hints  # 修复检测逻辑
-    console.print(f"攻击提示显示: {'✅ 是' if has_attack_hint else '❌ 否'}")
-
-    console.print("\n" + "-"*50 + "\n")
+    _report_scenario(console, game, player)
 
     # 场景3: 手中有可出牌 + 场上无随从
     console.print("📋 [bold cyan]场景3: 手中有可出牌 + 场上无随从[/bold cyan]")
     player.hand.append(spell)  # 重新添加法术
     player.field.clear()  # 清空场上
 
-    console.print(f"手牌数量: {len(player.hand)} (可出牌: {len([c for c in player.hand if c.cost <= player.mana])})")
-    console.print(f"场上随从: {len(player.field)}")
-
-    hints = game.get_simple_input_hints()
-    console.print(f"底部提示: {hints}")
-    has_attack_hint = "攻击" in hints  # 修复检测逻辑
-    console.print(f"攻击提示显示: {'✅ 是' if has_attack_hint else '❌ 否'}")
-
-    console.print("\n" + "-"*50 + "\n")
+    _report_scenario(console, game, player, show_attackable=False)
 
     # 显示完整游戏界面
     console.print("📋 [bold magenta]完整游戏界面演示：[/bold magenta]")
@@ -83,11 +83,13 @@ def debug_real_scenario():
 
     game.display_status()
 
-    console.print(f"\n🔍 [bold yellow]问题分析：[/bold yellow]")
-    console.print("如果攻击选项没有显示，可能的原因：")
-    console.print("1. 手牌优先级更高，攻击提示被覆盖")
-    console.print("2. 随从的can_attack属性设置有问题")
-    console.print("3. 提示文本被截断（终端宽度问题）")
+    console.print("\n".join([
+        "\n🔍 [bold yellow]问题分析：[/bold yellow]",
+        "如果攻击选项没有显示，可能的原因：",
+        "1. 手牌优先级更高，攻击提示被覆盖",
+        "2. 随从的can_attack属性设置有问题",
+        "3. 提示文本被截断（终端宽度问题）",
+    ]))
 
 if __name__ == "__main__":
     debug_real_scenario()
\ No newline at end of file
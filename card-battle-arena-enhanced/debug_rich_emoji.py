@@ -5,9 +5,57 @@
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
+from rich.text import Text
+import io
 import shutil
-
-console = Console()
+import sys
+
+# 先渲染到内存缓冲区，全部测试结束后一次性写出，避免每次 print 都刷新终端
+# 输出被重定向时关闭颜色和高亮
+_IS_TTY = sys.stdout.isatty()
+# 终端宽度在一次运行内不变，只查询一次
+_TERM_WIDTH = shutil.get_terminal_size().columns
+_buffer = io.StringIO()
+console = Console(file=_buffer, force_terminal=_IS_TTY, no_color=not _IS_TTY,
+                  highlight=_IS_TTY, width=_TERM_WIDTH)
+
+# 测试数据：带标记的单元格在模块加载时解析为Text，多个表格复用解析结果
+_RAW_STATS = (
+    ("0", "🔥3"),
+    ("1", "💚5"),
+    ("2", "✨"),
+    ("3", "5/3"),
+    ("4", "[red]🔥3[/red]"),
+    ("5", "[green]💚5[/green]"),
+    ("6", "[blue]✨[/blue]"),
+    ("7", "[red]5[/red]/[green]3[/green]")
+)
+_RAW_CARDS = (
+    ("0", "狂野之怒", "1", "[red]🔥3[/red]", "法术", "[green]✅ 可出[/green]"),
+    ("1", "治愈术", "2", "[green]💚5[/green]", "法术", "[green]✅ 可出[/green]"),
+    ("2", "奥术智慧", "3", "[blue]✨[/blue]", "法术", "[green]✅ 可出[/green]"),
+    ("3", "烈焰元素", "3", "[red]5[/red]/[green]3[/green]", "随从", "[green]✅ 可出[/green]"),
+)
+
+
+# 手牌表格的列定义：(标题, 列宽键, 样式, 对齐方式)
+_HAND_COLUMNS = (
+    ("编号", "index", "yellow", "right"),
+    ("卡牌", "name", "bold white", "left"),
+    ("费用", "cost", "blue", "center"),
+    ("属性", "stats", "red", "center"),
+    ("类型", "type", "magenta", "center"),
+    ("状态", "status", "green", "center"),
+)
+
+
+def _parse_cells(row):
+    return tuple(Text.from_markup(cell) if "[" in cell else cell for cell in row)
+
+
+_STATS_CELLS = tuple(_parse_cells(row) for row in _RAW_STATS)
+_CARD_CELLS = tuple(_parse_cells(row) for row in _RAW_CARDS)
+_RAW_STATS_LENGTHS = [len(stats) for _, stats in _RAW_STATS]
 
 def test_emoji_truncation():
     """测试 emoji 截断问题"""
@@ -15,7 +63,7 @@ def test_emoji_truncation():
     console.print("=" * 50)
 
     # 获取终端宽度
-    terminal_width = shutil.get_terminal_size().columns
+    terminal_width = _TERM_WIDTH
     console.print(f"终端宽度: {terminal_width}")
 
     # 测试不同宽度的列
@@ -29,25 +77,13 @@ def test_emoji_truncation():
         table.add_column("编号", width=6, justify="right")
         table.add_column("属性", width=width, justify="center")
 
-        # 测试数据
-        test_data = [
-            ("0", "🔥3"),
-            ("1", "💚5"),
-            ("2", "✨"),
-            ("3", "5/3"),
-            ("4", "[red]🔥3[/red]"),
-            ("5", "[green]💚5[/green]"),
-            ("6", "[blue]✨[/blue]"),
-            ("7", "[red]5[/red]/[green]3[/green]")
-        ]
-
-        for idx, stats in test_data:
+        for idx, stats in _STATS_CELLS:
             table.add_row(idx, stats)
 
         console.print(table)
 
-        # 检查实际内容长度
-        console.print(f"   测试数据长度: {[len(stats) for _, stats in test_data]}")
+        # 检查实际内容长度（原始标记字符串）
+        console.print(f"   测试数据长度: {_RAW_STATS_LENGTHS}")
 
     # 测试不指定宽度的情况
     console.print(f"\n🔄 [bold yellow]不指定列宽的测试：[/bold yellow]")
@@ -55,7 +91,7 @@ def test_emoji_truncation():
     auto_table.add_column("编号", justify="right")
     auto_table.add_column("属性", justify="center")
 
-    for idx, stats in test_data:
+    for idx, stats in _STATS_CELLS:
         auto_table.add_row(idx, stats)
 
     console.print(auto_table)
@@ -66,7 +102,7 @@ def test_emoji_truncation():
     min_table.add_column("编号", min_width=6, justify="right")
     min_table.add_column("属性", min_width=8, justify="center")
 
-    for idx, stats in test_data:
+    for idx, stats in _STATS_CELLS:
         min_table.add_row(idx, stats)
 
     console.print(min_table)
@@ -77,7 +113,7 @@ def test_emoji_truncation():
     overflow_table.add_column("编号", width=6, justify="right")
     overflow_table.add_column("属性", width=8, justify="center", overflow="fold")
 
-    for idx, stats in test_data:
+    for idx, stats in _STATS_CELLS:
         overflow_table.add_row(idx, stats)
 
     console.print(overflow_table)
@@ -88,7 +124,7 @@ def test_game_table_scenario():
     console.print("=" * 50)
 
     # 模拟游戏的表格设置
-    terminal_width = shutil.get_terminal_size().columns
+    terminal_width = _TERM_WIDTH
     console.print(f"终端宽度: {terminal_width}")
 
     # 游戏中的列宽计算
@@ -116,26 +152,19 @@ def test_game_table_scenario():
 
     # 创建游戏风格的表格
     game_table = Table(title="🃏 手牌测试", show_header=True)
-    game_table.add_column("编号", style="yellow", width=min_widths["index"], justify="right")
-    game_table.add_column("卡牌", style="bold white", width=min_widths["name"], justify="left")
-    game_table.add_column("费用", style="blue", width=min_widths["cost"], justify="center")
-    game_table.add_column("属性", style="red", width=min_widths["stats"], justify="center")
-    game_table.add_column("类型", style="magenta", width=min_widths["type"], justify="center")
-    game_table.add_column("状态", style="green", width=min_widths["status"], justify="center")
+    for header, key, style, justify in _HAND_COLUMNS:
+        game_table.add_column(header, style=style, width=min_widths[key], justify=justify)
 
     # 添加测试数据
-    test_cards = [
-        ("0", "狂野之怒", "1", "[red]🔥3[/red]", "法术", "[green]✅ 可出[/green]"),
-        ("1", "治愈术", "2", "[green]💚5[/green]", "法术", "[green]✅ 可出[/green]"),
-        ("2", "奥术智慧", "3", "[blue]✨[/blue]", "法术", "[green]✅ 可出[/green]"),
-        ("3", "烈焰元素", "3", "[red]5[/red]/[green]3[/green]", "随从", "[green]✅ 可出[/green]"),
-    ]
-
-    for card_data in test_cards:
+    for card_data in _CARD_CELLS:
         game_table.add_row(*card_data)
 
     console.print(Panel(game_table, border_style="cyan"))
 
 if __name__ == "__main__":
-    test_emoji_truncation()
-    test_game_table_scenario()
\ No newline at end of file
+    try:
+        test_emoji_truncation()
+        test_game_table_scenario()
+    finally:
+        sys.stdout.write(_buffer.getvalue())
+        sys.stdout.flush()
\ No newline at end of file
@@ -4,6 +4,7 @@
 """
 
 import asyncio
+import time
 import sys
 import os
 import logging
@@ -111,14 +112,13 @@ async def test_rule_based_strategy():
     
     # 测试AI决策
     console.print(f"\n[bold magenta]规则AI开始决策...[/bold magenta]")
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.perf_counter()
     
     try:
         # 执行决策
         action = await strategy.execute_with_timing(context)
         
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         
         if action:
             console.print(f"[bold green]✅ 规则AI决策完成！[/bold green]")
@@ -131,13 +131,11 @@ async def test_rule_based_strategy():
             console.print(f"  耗时: {elapsed_time:.2f}秒")
             
     except Exception as e:
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         console.print(f"[bold red]💥 规则AI决策出错: {e}[/bold red]")
         console.print(f"  耗时: {elapsed_time:.2f}秒")
-        import traceback
         console.print(f"[red]详细错误信息:[/red]")
-        console.print(traceback.format_exc())
+        console.print_exception()
 
 if __name__ == "__main__":
     # 设置日志级别
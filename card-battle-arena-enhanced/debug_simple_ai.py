@@ -3,7 +3,7 @@
 简单的AI调试脚本，用于诊断AI卡住的问题
 """
 
-import asyncio
+import time
 import sys
 import os
 import logging
@@ -63,8 +63,8 @@ def create_simple_ai_agent():
     
     return ai_agent
 
-async def test_simple_ai_decision():
-    """测试简单AI决策"""
+def test_simple_ai_decision():
+    """测试简单AI决策（decide_action 是同步接口，自行管理事件循环）"""
     console.print("[bold yellow]开始测试简单AI决策[/bold yellow]")
     
     # 创建游戏和AI
@@ -78,9 +78,7 @@ async def test_simple_ai_decision():
         Card("治疗术", 2, 0, 5, "spell", [], "恢复5点生命")
     ]
     
-    game.players[1].hand.clear()
-    for card in test_cards:
-        game.players[1].hand.append(card)
+    game.players[1].hand[:] = test_cards
     
     # 设置足够的法力值
     game.players[1].mana = 10
@@ -97,14 +95,13 @@ async def test_simple_ai_decision():
     
     # 测试AI决策
     console.print(f"\n[bold magenta]AI开始决策...[/bold magenta]")
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.perf_counter()
     
     try:
         # 使用AI代理的决策方法
         action = ai_agent.decide_action(game.players[1], game)
         
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         
         if action:
             console.print(f"[bold green]✅ AI决策完成！[/bold green]")
@@ -117,8 +114,7 @@ async def test_simple_ai_decision():
             console.print(f"  耗时: {elapsed_time:.2f}秒")
             
     except Exception as e:
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         console.print(f"[bold red]💥 AI决策出错: {e}[/bold red]")
         console.print(f"  耗时: {elapsed_time:.2f}秒")
         import traceback
@@ -130,4 +126,4 @@ if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
     
     # 运行测试
-    asyncio.run(test_simple_ai_decision())
\ No newline at end of file
+    test_simple_ai_decision()
\ No newline at end of file
@@ -4,6 +4,7 @@
 """
 
 import asyncio
+import time
 import sys
 import os
 import logging
@@ -77,9 +78,7 @@ async def test_simple_ai_decision_with_timeout():
         Card("治疗术", 2, 0, 5, "spell", [], "恢复5点生命")
     ]
     
-    game.players[1].hand.clear()
-    for card in test_cards:
-        game.players[1].hand.append(card)
+    game.players[1].hand[:] = test_cards
     
     # 设置足够的法力值
     game.players[1].mana = 10
@@ -96,7 +95,7 @@ async def test_simple_ai_decision_with_timeout():
     
     # 测试AI决策
     console.print(f"\n[bold magenta]AI开始决策...[/bold magenta]")
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.perf_counter()
     
     try:
         # 使用超时机制运行AI决策
@@ -105,8 +104,7 @@ async def test_simple_ai_decision_with_timeout():
             timeout=10.0  # 10秒超时
         )
         
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         
         if action:
             console.print(f"[bold green]✅ AI决策完成！[/bold green]")
@@ -119,13 +117,11 @@ async def test_simple_ai_decision_with_timeout():
             console.print(f"  耗时: {elapsed_time:.2f}秒")
             
     except asyncio.TimeoutError:
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         console.print(f"[bold red]⏰ AI决策超时！[/bold red]")
         console.print(f"  耗时: {elapsed_time:.2f}秒")
     except Exception as e:
-        end_time = asyncio.get_event_loop().time()
-        elapsed_time = end_time - start_time
+        elapsed_time = time.perf_counter() - start_time
         console.print(f"[bold red]💥 AI决策出错: {e}[/bold red]")
         console.print(f"  耗时: {elapsed_time:.2f}秒")
         import traceback
@@ -24,16 +24,14 @@ def debug_spell_display():
     game = CardGame("测试玩家", "测试对手")
     player = game.players[0]
 
-    # 清空手牌并添加不同类型的法术
-    player.hand.clear()
+    # 用不同类型的法术替换手牌
     spells = [
         Card("狂野之怒", 1, 3, 0, "spell", [], "💢 释放原始怒火，对敌人造成3点伤害"),
         Card("治愈术", 2, -5, 0, "spell", [], "💚 圣光之力，恢复5点生命值"),
         Card("奥术智慧", 3, 0, 0, "spell", ["draw_cards"], "📚 深奥的魔法知识，从虚空中抽取两张卡牌"),
     ]
 
-    for spell in spells:
-        player.hand.append(spell)
+    player.hand[:] = spells
     player.mana = 10
     player.max_mana = 10
 
@@ -41,11 +39,16 @@ def debug_spell_display():
     for i, spell in enumerate(spells):
         console.print(f"   {i}. {spell.name} (攻击力: {spell.attack})")
 
-    # 获取游戏状态
+    # 获取游戏状态：只取一次快照，分析、独立表格和游戏界面共用
     console.print(f"\n🔍 [bold yellow]检查游戏状态数据：[/bold yellow]")
     state = game.get_game_state()
     hand_cards = state["current_player_state"]["hand"]
 
+    test_table = Table(title="独立测试表格", show_header=True)
+    test_table.add_column("卡牌", style="bold white", justify="left")
+    test_table.add_column("属性", style="red", justify="center")
+
+    # 单次遍历手牌，同时输出分析信息并填充表格行
     for i, card_data in enumerate(hand_cards):
         console.print(f"\n   卡牌 {i}: {card_data['name']}")
         console.print(f"     原始数据: type={card_data['type']}, attack={card_data['attack']}")
@@ -57,41 +60,28 @@ def debug_spell_display():
         if card_type == "spell":
             if attack > 0:
                 expected_stats = f"🔥{attack}"
+                stats_display = f"[red]{expected_stats}[/red]"
             elif attack < 0:
                 expected_stats = f"💚{-attack}"
+                stats_display = f"[green]{expected_stats}[/green]"
             else:
                 expected_stats = "✨"
+                stats_display = f"[blue]{expected_stats}[/blue]"
 
             console.print(f"     预期显示: {expected_stats}")
-            console.print(f"     实际显示逻辑: [red]{expected_stats}[/red]" if attack > 0 else f"[green]{expected_stats}[/green]" if attack < 0 else f"[blue]{expected_stats}[/blue]")
-
-    # 测试独立的Rich表格
-    console.print(f"\n📊 [bold magenta]测试独立Rich表格：[/bold magenta]")
-    test_table = Table(title="独立测试表格", show_header=True)
-    test_table.add_column("卡牌", style="bold white", justify="left")
-    test_table.add_column("属性", style="red", justify="center")
-
-    for card_data in hand_cards:
-        card_type = card_data.get('type', '')
-        attack = card_data.get('attack', 0)
-
-        if card_type == "spell":
-            if attack > 0:
-                stats_display = f"[red]🔥{attack}[/red]"
-            elif attack < 0:
-                stats_display = f"[green]💚{-attack}[/green]"
-            else:
-                stats_display = "[blue]✨[/blue]"
+            console.print(f"     实际显示逻辑: {stats_display}" if attack > 0 else stats_display)
         else:
             stats_display = "N/A"
 
         test_table.add_row(card_data['name'], stats_display)
 
+    # 测试独立的Rich表格
+    console.print(f"\n📊 [bold magenta]测试独立Rich表格：[/bold magenta]")
     console.print(test_table)
 
     # 检查实际的game.display_status()输出
     console.print(f"\n🎮 [bold green]实际游戏界面：[/bold green]")
-    game.display_status()
+    game.display_status(state=state)
 
     console.print(f"\n🔧 [bold blue]问题分析：[/bold blue]")
     console.print("1. 数据层面: ✅ 游戏状态数据正确")
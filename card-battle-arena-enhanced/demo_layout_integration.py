@@ -4,6 +4,7 @@
 展示真正的界面变化
 """
 import asyncio
+import os
 import sys
 from pathlib import Path
 
@@ -13,11 +14,13 @@ sys.path.insert(0, str(project_root))
 
 from game_ui import GameLayout, GameUIWithLive
 from rich.console import Console
-from rich.live import Live
 import time
 
 console = Console()
 
+# 状态切换间隔（秒），设置 DEMO_SLEEP=0 可跳过等待，只测量渲染耗时
+DEMO_SLEEP = float(os.environ.get("DEMO_SLEEP", 3))
+
 def create_sample_game_state():
     """创建示例游戏状态"""
     return {
@@ -172,7 +175,7 @@ async def demo_live_updates():
         for i, (state, message) in enumerate(zip(game_states, messages)):
             ui_manager.update_game_state(state)
             console.print(f"\n[dim]{message}[/dim]")
-            await asyncio.sleep(3)
+            await asyncio.sleep(DEMO_SLEEP)
     except KeyboardInterrupt:
         console.print("\n[yellow]演示已停止[/yellow]")
     finally:
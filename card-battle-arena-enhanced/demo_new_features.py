@@ -5,6 +5,7 @@
 """
 import asyncio
 import random
+import sys
 from game_engine.card_game import CardGame
 
 
@@ -65,30 +66,34 @@ async def demo_simplified_interaction():
 
 def demo_quick_commands():
     """演示快速命令"""
-    print("\n🎯 快速命令演示:")
-    print("=" * 50)
-    print("✅ 新的交互方式:")
-    print("  • 直接输入数字出牌 (如: 0, 1, 2)")
-    print("  • 输入 '技' 或 '技能' 使用英雄技能")
-    print("  • 输入回车或空格结束回合 (自动攻击)")
-    print("  • 输入 '帮' 查看帮助")
-    print("  • 输入 '状态' 查看游戏状态")
-    print("  • 输入 '随从攻击 0 英雄' 手动攻击")
-    print("  • 输入 '英雄攻击' 英雄直接攻击")
-    print("  • 输入 '退出' 退出游戏")
-
-    print("\n⚡ 智能特性:")
-    print("  • 自动攻击: 结束回合时智能选择攻击目标")
-    print("  • 优先击杀: 优先消灭低血量随从")
-    print("  • 嘲讽处理: 自动处理嘲讽随从")
-    print("  • 潜行机制: 潜行随从免疫反击")
-    print("  • 快捷提示: 实时显示可用操作")
+    lines = [
+        "\n🎯 快速命令演示:",
+        "=" * 50,
+        "✅ 新的交互方式:",
+        "  • 直接输入数字出牌 (如: 0, 1, 2)",
+        "  • 输入 '技' 或 '技能' 使用英雄技能",
+        "  • 输入回车或空格结束回合 (自动攻击)",
+        "  • 输入 '帮' 查看帮助",
+        "  • 输入 '状态' 查看游戏状态",
+        "  • 输入 '随从攻击 0 英雄' 手动攻击",
+        "  • 输入 '英雄攻击' 英雄直接攻击",
+        "  • 输入 '退出' 退出游戏",
+
+        "\n⚡ 智能特性:",
+        "  • 自动攻击: 结束回合时智能选择攻击目标",
+        "  • 优先击杀: 优先消灭低血量随从",
+        "  • 嘲讽处理: 自动处理嘲讽随从",
+        "  • 潜行机制: 潜行随从免疫反击",
+        "  • 快捷提示: 实时显示可用操作"
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_attack_intelligence():
     """演示攻击智能"""
-    print("\n🧠 攻击智能演示:")
-    print("=" * 50)
+    lines = []
+    lines.append("\n🧠 攻击智能演示:")
+    lines.append("=" * 50)
 
     # 创建测试场景
     game = CardGame("测试玩家", "测试AI")
@@ -115,30 +120,31 @@ def demo_attack_intelligence():
     for minion in player.field:
         minion.can_attack = True
 
-    print("📊 测试场景:")
-    print("  玩家随从:")
+    lines.append("📊 测试场景:")
+    lines.append("  玩家随从:")
     for i, minion in enumerate(player.field):
         mechanics = f" [{', '.join(minion.mechanics)}]" if minion.mechanics else ""
-        print(f"    {i}: {minion.name} ({minion.attack}/{minion.health}){mechanics}")
+        lines.append(f"    {i}: {minion.name} ({minion.attack}/{minion.health}){mechanics}")
 
-    print("  AI随从:")
+    lines.append("  AI随从:")
     for i, minion in enumerate(ai.field):
         mechanics = f" [{', '.join(minion.mechanics)}]" if minion.mechanics else ""
-        print(f"    {i}: {minion.name} ({minion.attack}/{minion.health}){mechanics}")
+        lines.append(f"    {i}: {minion.name} ({minion.attack}/{minion.health}){mechanics}")
 
-    print("\n🤖 智能攻击决策:")
+    lines.append("\n🤖 智能攻击决策:")
     messages = game._smart_combat_phase()
     if messages:
-        print("  执行的攻击:")
+        lines.append("  执行的攻击:")
         for msg in messages:
-            print(f"    • {msg}")
+            lines.append(f"    • {msg}")
     else:
-        print("  没有可执行的攻击")
+        lines.append("  没有可执行的攻击")
 
-    print(f"\n📈 攻击结果:")
-    print(f"  玩家剩余随从: {len(player.field)} 个")
-    print(f"  AI剩余随从: {len(ai.field)} 个")
-    print(f"  AI生命值: {ai.health}/{ai.max_health}")
+    lines.append(f"\n📈 攻击结果:")
+    lines.append(f"  玩家剩余随从: {len(player.field)} 个")
+    lines.append(f"  AI剩余随从: {len(ai.field)} 个")
+    lines.append(f"  AI生命值: {ai.health}/{ai.max_health}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -4,6 +4,7 @@
 展示TDD开发的成果
 """
 import asyncio
+import os
 import sys
 from pathlib import Path
 
@@ -13,7 +14,11 @@ sys.path.insert(0, str(project_root))
 
 from game_ui import GameLayout, GameUIWithLive
 from rich.console import Console
-from rich.live import Live
+
+console = Console()
+
+# 状态切换间隔（秒），设置 DEMO_SLEEP=0 可跳过等待，只测量渲染耗时
+DEMO_SLEEP = float(os.environ.get("DEMO_SLEEP", 2))
 
 
 def create_demo_game_state():
@@ -55,7 +60,6 @@ def create_demo_game_state():
 
 def demo_static_layout():
     """演示静态Layout"""
-    console = Console()
     console.print("🎮 [bold blue]Rich Layout系统演示[/bold blue]")
     console.print("=" * 50)
 
@@ -78,7 +82,6 @@ def demo_static_layout():
 
 def demo_live_layout():
     """演示Live动态刷新"""
-    console = Console()
     console.print("\n🔄 [bold green]Live动态刷新演示[/bold green]")
     console.print("模拟游戏状态变化...")
     console.print("按 Ctrl+C 停止演示")
@@ -155,7 +158,7 @@ def demo_live_layout():
             elif i % 3 == 2:
                 console.print("\n[dim]⚔️ 召唤烈焰元素！[/dim]")
 
-            await asyncio.sleep(2)
+            await asyncio.sleep(DEMO_SLEEP)
 
     except KeyboardInterrupt:
         console.print("\n[yellow]演示已停止[/yellow]")
@@ -165,7 +168,6 @@ def demo_live_layout():
 
 def demo_responsive_layout():
     """演示响应式布局"""
-    console = Console()
     console.print("\n📱 [bold cyan]响应式布局演示[/bold cyan]")
     console.print("=" * 50)
 
@@ -182,7 +184,6 @@ def demo_responsive_layout():
 
 async def main():
     """主演示函数"""
-    console = Console()
     console.print("🎯 [bold magenta]Rich Layout重构演示[/bold magenta]")
     console.print("通过TDD方式开发的新界面系统")
     console.print("=" * 60)
@@ -6,6 +6,7 @@
 import functools
 import logging
 import asyncio
+import reprlib
 from typing import Callable, Any, Optional, Union, List, Tuple
 from error_handler import (
     ErrorHandler, ErrorCategory, ErrorSeverity, ErrorInfo,
@@ -15,6 +16,24 @@ from error_handler import (
 logger = logging.getLogger(__name__)
 
 
+def _bounded_repr(limit: int) -> Callable[[Any], str]:
+    """创建有界repr：大容器只展开前几项，不会先生成完整字符串，结果总长度不超过limit"""
+    r = reprlib.Repr()
+    r.maxstring = limit
+    r.maxother = limit
+
+    def bounded(value: Any) -> str:
+        text = r.repr(value)
+        return text if len(text) <= limit else text[:limit - 3] + "..."
+
+    return bounded
+
+
+# 错误上下文中记录参数用的表示函数
+_args_repr = _bounded_repr(200)
+_value_repr = _bounded_repr(100)
+
+
 def safe_execute(
     default_return: Any = None,
     error_category: ErrorCategory = ErrorCategory.SYSTEM,
@@ -25,31 +44,34 @@ def safe_execute(
 ):
     """安全执行装饰器"""
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                if log_errors:
-                    error_info = handle_error(
-                        exception=e,
-                        category=error_category,
-                        severity=error_severity,
-                        title=f"函数 {func.__name__} 执行失败",
-                        context={
-                            "function": func.__name__,
-                            "args": str(args)[:200],  # 限制长度
-                            "kwargs": str(kwargs)[:200],
-                            **(context or {})
-                        }
-                    )
-                    if re_raise:
-                        raise
-                    return default_return
-                else:
-                    if re_raise:
-                        raise
-                    return default_return
+        # 根据函数是否是协程只构建需要的包装器
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await func(*args, **kwargs)
+                except Exception as e:
+                    if log_errors:
+                        error_info = handle_error(
+                            exception=e,
+                            category=error_category,
+                            severity=error_severity,
+                            title=f"函数 {func.__name__} 执行失败",
+                            context={
+                                "function": func.__name__,
+                                "args": _args_repr(args),  # 限制长度
+                                "kwargs": _args_repr(kwargs),
+                                **(context or {})
+                            }
+                        )
+                        if re_raise:
+                            raise
+                        return default_return
+                    else:
+                        if re_raise:
+                            raise
+                        return default_return
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -64,8 +86,8 @@ def safe_execute(
                         title=f"函数 {func.__name__} 执行失败",
                         context={
                             "function": func.__name__,
-                            "args": str(args)[:200],
-                            "kwargs": str(kwargs)[:200],
+                            "args": _args_repr(args),
+                            "kwargs": _args_repr(kwargs),
                             **(context or {})
                         }
                     )
@@ -77,11 +99,7 @@ def safe_execute(
                         raise
                     return default_return
 
-        # 根据函数是否是协程选择包装器
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
     return decorator
 
@@ -93,27 +111,13 @@ def validate_input(
 ):
     """输入验证装饰器"""
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            for i, validator in enumerate(validators):
-                if i < len(args):
-                    if not validator(args[i]):
-                        error_info = handle_error(
-                            category=error_category,
-                            severity=ErrorSeverity.ERROR,
-                            title="输入验证失败",
-                            message=error_message,
-                            context={
-                                "function": func.__name__,
-                                "argument_index": i,
-                                "argument_value": str(args[i])[:100]
-                            }
-                        )
-                        return (False, format_error_feedback(error_info), None)
-                else:
-                    # 检查kwargs
-                    for key, value in kwargs.items():
-                        if not validator(value):
+        # 根据函数是否是协程只构建需要的包装器
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for i, validator in enumerate(validators):
+                    if i < len(args):
+                        if not validator(args[i]):
                             error_info = handle_error(
                                 category=error_category,
                                 severity=ErrorSeverity.ERROR,
@@ -121,12 +125,29 @@ def validate_input(
                                 message=error_message,
                                 context={
                                     "function": func.__name__,
-                                    "argument_key": key,
-                                    "argument_value": str(value)[:100]
+                                    "argument_index": i,
+                                    "argument_value": _value_repr(args[i])
                                 }
                             )
                             return (False, format_error_feedback(error_info), None)
-            return await func(*args, **kwargs)
+                    else:
+                        # 检查kwargs
+                        for key, value in kwargs.items():
+                            if not validator(value):
+                                error_info = handle_error(
+                                    category=error_category,
+                                    severity=ErrorSeverity.ERROR,
+                                    title="输入验证失败",
+                                    message=error_message,
+                                    context={
+                                        "function": func.__name__,
+                                        "argument_key": key,
+                                        "argument_value": _value_repr(value)
+                                    }
+                                )
+                                return (False, format_error_feedback(error_info), None)
+                return await func(*args, **kwargs)
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -141,7 +162,7 @@ def validate_input(
                             context={
                                 "function": func.__name__,
                                 "argument_index": i,
-                                "argument_value": str(args[i])[:100]
+                                "argument_value": _value_repr(args[i])
                             }
                         )
                         return (False, format_error_feedback(error_info), None)
@@ -157,17 +178,13 @@ def validate_input(
                                 context={
                                     "function": func.__name__,
                                     "argument_key": key,
-                                    "argument_value": str(value)[:100]
+                                    "argument_value": _value_repr(value)
                                 }
                             )
                             return (False, format_error_feedback(error_info), None)
             return func(*args, **kwargs)
 
-        # 根据函数是否是协程选择包装器
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
     return decorator
 
@@ -181,33 +198,36 @@ def retry_on_error(
 ):
     """重试装饰器"""
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            last_exception = None
-            current_delay = delay
-
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except retry_on as e:
-                    last_exception = e
-                    if attempt < max_retries:
-                        logger.warning(f"函数 {func.__name__} 第 {attempt + 1} 次尝试失败: {e}, {current_delay}秒后重试")
-                        await asyncio.sleep(current_delay)
-                        current_delay *= backoff_factor
-                    else:
-                        error_info = handle_error(
-                            exception=e,
-                            category=error_category,
-                            severity=ErrorSeverity.ERROR,
-                            title=f"函数 {func.__name__} 重试失败",
-                            context={
-                                "function": func.__name__,
-                                "max_retries": max_retries,
-                                "attempts": attempt + 1
-                            }
-                        )
-                        raise
+        # 根据函数是否是协程只构建需要的包装器
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                last_exception = None
+                current_delay = delay
+
+                for attempt in range(max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except retry_on as e:
+                        last_exception = e
+                        if attempt < max_retries:
+                            logger.warning(f"函数 {func.__name__} 第 {attempt + 1} 次尝试失败: {e}, {current_delay}秒后重试")
+                            await asyncio.sleep(current_delay)
+                            current_delay *= backoff_factor
+                        else:
+                            error_info = handle_error(
+                                exception=e,
+                                category=error_category,
+                                severity=ErrorSeverity.ERROR,
+                                title=f"函数 {func.__name__} 重试失败",
+                                context={
+                                    "function": func.__name__,
+                                    "max_retries": max_retries,
+                                    "attempts": attempt + 1
+                                }
+                            )
+                            raise
+            return async_wrapper
 
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
@@ -238,11 +258,7 @@ def retry_on_error(
                         )
                         raise
 
-        # 根据函数是否是协程选择包装器
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
+        return sync_wrapper
 
     return decorator
 
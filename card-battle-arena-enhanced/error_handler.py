@@ -46,6 +46,7 @@ class ErrorInfo:
     exception: Optional[Exception] = None
     timestamp: Optional[float] = None
     context: Optional[Dict[str, Any]] = None
+    template_key: Optional[str] = None  # 首次格式化时计算并缓存
 
     def __post_init__(self):
         if self.suggestions is None:
@@ -54,6 +55,25 @@ class ErrorInfo:
             self.context = {}
 
 
+# 各错误类别的模板键规则：按顺序匹配消息关键词，关键词为None的规则总是匹配
+_CATEGORY_TEMPLATE_RULES: Dict[ErrorCategory, Tuple[Tuple[Optional[str], str], ...]] = {
+    ErrorCategory.COMMAND: (
+        ("not found", "command_not_found"),
+        ("format", "invalid_command_format"),
+        (None, "command_not_available"),
+    ),
+    ErrorCategory.GAME_STATE: (
+        ("turn", "not_your_turn"),
+        ("mana", "insufficient_mana"),
+        ("index", "invalid_card_index"),
+        ("target", "invalid_target"),
+    ),
+    ErrorCategory.VALIDATION: ((None, "validation_failed"),),
+    ErrorCategory.AI_DECISION: ((None, "ai_decision_failed"),),
+    ErrorCategory.SYSTEM: ((None, "system_error"),),
+}
+
+
 class FeedbackManager:
     """反馈管理器 - 提供用户友好的错误信息和建议"""
 
@@ -156,30 +176,19 @@ class FeedbackManager:
         return formatted_message
 
     def _get_template_key(self, error_info: ErrorInfo) -> str:
-        """根据错误信息获取模板键"""
-        # 简化实现：基于错误类别和消息内容
-        if error_info.category == ErrorCategory.COMMAND:
-            if "not found" in error_info.message.lower():
-                return "command_not_found"
-            elif "format" in error_info.message.lower():
-                return "invalid_command_format"
-            else:
-                return "command_not_available"
-        elif error_info.category == ErrorCategory.GAME_STATE:
-            if "turn" in error_info.message.lower():
-                return "not_your_turn"
-            elif "mana" in error_info.message.lower():
-                return "insufficient_mana"
-            elif "index" in error_info.message.lower():
-                return "invalid_card_index"
-            elif "target" in error_info.message.lower():
-                return "invalid_target"
-        elif error_info.category == ErrorCategory.VALIDATION:
-            return "validation_failed"
-        elif error_info.category == ErrorCategory.AI_DECISION:
-            return "ai_decision_failed"
-        elif error_info.category == ErrorCategory.SYSTEM:
-            return "system_error"
+        """根据错误信息获取模板键，结果缓存在ErrorInfo上，重复格式化时不再扫描消息"""
+        if error_info.template_key is None:
+            error_info.template_key = self._compute_template_key(error_info)
+        return error_info.template_key
+
+    @staticmethod
+    def _compute_template_key(error_info: ErrorInfo) -> str:
+        """基于错误类别和消息内容匹配模板键"""
+        rules = _CATEGORY_TEMPLATE_RULES.get(error_info.category, ())
+        message = (error_info.message or "").lower()
+        for keyword, template_key in rules:
+            if keyword is None or keyword in message:
+                return template_key
 
         return "unexpected_error"
 
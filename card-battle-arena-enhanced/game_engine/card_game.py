@@ -5,12 +5,29 @@ Card Battle Arena Enhanced - 卡牌游戏核心引擎
 import random
 import asyncio
 import logging
+import re
 import shutil
+from functools import lru_cache
 from typing import List, Dict, Optional, Any
 from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
+# 随从目标格式 "随从_N"（兼容 "随从N"），一次匹配完成格式校验和索引提取
+_MINION_TARGET_RE = re.compile(r"随从_?(\d+)")
+# 场上随从索引很小，直接查表避免重复 int() 转换
+_INDEX_CACHE = {str(i): i for i in range(32)}
+
+
+def parse_minion_target(target: str) -> Optional[int]:
+    """解析随从目标字符串，返回随从索引；格式不符时返回None"""
+    match = _MINION_TARGET_RE.fullmatch(target)
+    if match is None:
+        return None
+    digits = match.group(1)
+    index = _INDEX_CACHE.get(digits)
+    return int(digits) if index is None else index
+
 
 def get_terminal_width() -> int:
     """获取终端宽度，失败时返回默认值"""
@@ -54,6 +71,21 @@ def calculate_table_widths(terminal_width: int, min_widths: Dict[str, int],
     Returns:
         各列的实际宽度
     """
+    # 每次刷新界面都用相同的终端宽度和列定义计算，按参数缓存结果；返回新字典防止调用方改动缓存
+    return dict(_cached_table_widths(terminal_width, tuple(min_widths.items()), total_min_width))
+
+
+@lru_cache(maxsize=32)
+def _cached_table_widths(terminal_width: int, min_width_items: tuple,
+                         total_min_width: int) -> tuple:
+    """calculate_table_widths 的可缓存实现，参数和返回值都用元组表示"""
+    result = _compute_table_widths(terminal_width, dict(min_width_items), total_min_width)
+    return tuple(result.items())
+
+
+def _compute_table_widths(terminal_width: int, min_widths: Dict[str, int],
+                          total_min_width: int) -> Dict[str, int]:
+    """实际的列宽计算逻辑"""
     # 处理终端宽度异常情况
     if terminal_width < 40:  # 极窄终端
         terminal_width = 40
@@ -195,6 +227,8 @@ class Card:
     mechanics: List[str] = field(default_factory=list)
     instance_id: str = ""
     description: str = ""
+    # 类属性默认值（非dataclass字段），法术牌等未设置攻击状态的卡牌也能直接访问
+    can_attack = False
 
     def __post_init__(self):
         if not self.instance_id:
@@ -275,9 +309,13 @@ class CardGame:
         self.turn_number = 1
         self.game_over = False
         self.winner = None
+        # 状态版本号 - 每次可能改变游戏状态的操作都会递增，用于缓存失效
+        self.turn_version = 0
 
-        # 初始化卡牌池
+        # 初始化卡牌池，并按类型预先分组供抽牌使用（卡牌池在对局中不变）
         self.card_pool = self._create_card_pool()
+        self._pool_minions = [card for card in self.card_pool if card.card_type == "minion"]
+        self._pool_spells = [card for card in self.card_pool if card.card_type == "spell"]
 
         # 初始抽牌
         self._initial_draw()
@@ -402,23 +440,24 @@ class CardGame:
 
     def _smart_draw_card(self, player: Player) -> Card:
         """智能抽牌系统 - 平衡随从和法术比例，防止重复"""
-        # 统计手牌中的随从和法术数量
-        minion_count = sum(1 for card in player.hand if card.card_type == "minion")
-        spell_count = sum(1 for card in player.hand if card.card_type == "spell")
-
-        # 获取手牌中已有卡牌的名称集合，防止重复
-        hand_card_names = {get_card_name(card) for card in player.hand}
-
-        # 分离卡牌池中的随从和法术，并过滤掉已有的卡牌
-        minions = [card for card in self.card_pool
-                  if card.card_type == "minion" and get_card_name(card) not in hand_card_names]
-        spells = [card for card in self.card_pool
-                 if card.card_type == "spell" and get_card_name(card) not in hand_card_names]
+        # 单次遍历手牌，统计随从/法术数量并收集已有卡牌名称（防止重复）
+        minion_count = spell_count = 0
+        hand_card_names = set()
+        for card in player.hand:
+            if card.card_type == "minion":
+                minion_count += 1
+            elif card.card_type == "spell":
+                spell_count += 1
+            hand_card_names.add(get_card_name(card))
+
+        # 从预分组的卡牌池中过滤掉已有的卡牌
+        minions = [card for card in self._pool_minions if get_card_name(card) not in hand_card_names]
+        spells = [card for card in self._pool_spells if get_card_name(card) not in hand_card_names]
 
         # 如果过滤后没有可选卡牌，则允许重复（备用方案）
         if not minions and not spells:
-            minions = [card for card in self.card_pool if card.card_type == "minion"]
-            spells = [card for card in self.card_pool if card.card_type == "spell"]
+            minions = self._pool_minions
+            spells = self._pool_spells
 
         # 智能抽牌策略
         if minion_count < spell_count - 1:
@@ -445,17 +484,24 @@ class CardGame:
 
     def _cleanup_dead_minions(self, player: Player) -> List[str]:
         """清理生命值<=0的随从，返回被移除的随从名称列表"""
-        dead_minions = []
-        # 使用反向迭代来安全删除元素
-        for minion in player.field[:]:  # 创建列表副本
-            if get_card_health(minion) <= 0:
-                dead_minions.append(get_card_name(minion))
-                player.field.remove(minion)
-                logger.debug(f"💀 {get_card_name(minion)} 因生命值耗尽被移除")
+        # 单次遍历划分存活和死亡随从，避免逐个 list.remove() 的 O(n²) 开销
+        alive, dead = [], []
+        for minion in player.field:
+            (alive if get_card_health(minion) > 0 else dead).append(minion)
+
+        if not dead:
+            return []
+
+        # 原地替换，保持其他地方持有的 field 列表引用有效
+        player.field[:] = alive
+        dead_minions = [get_card_name(minion) for minion in dead]
+        for name in dead_minions:
+            logger.debug(f"💀 {name} 因生命值耗尽被移除")
         return dead_minions
 
     def start_turn(self):
         """开始新的回合"""
+        self.turn_version += 1
         current = self.get_current_player()
         current.start_turn()
 
@@ -494,6 +540,7 @@ class CardGame:
         """打出卡牌（支持目标选择）"""
         if player_idx != self.current_player_idx:
             return {"success": False, "message": "不是你的回合"}
+        self.turn_version += 1
 
         player = self.players[player_idx]
         if card_idx >= len(player.hand):
@@ -636,39 +683,11 @@ class CardGame:
                 "success": True,
                 "message": f"，造成 {card.attack} 点伤害到英雄"
             }
-        elif target.startswith("随从_"):
-            try:
-                target_idx = int(target.split("_")[1])
-                if target_idx >= len(opponent.field):
-                    return {"success": False, "message": f"无效的目标随从索引: {target_idx}"}
-
-                target_minion = opponent.field[target_idx]
-
-                # 检查是否必须攻击嘲讽
-                taunt_minions = [m for m in opponent.field if "taunt" in m.mechanics]
-                if taunt_minions and target_minion not in taunt_minions:
-                    return {"success": False, "message": "必须先攻击嘲讽随从"}
-
-                # 造成伤害
-                original_health = target_minion.health
-                target_minion.health -= card.attack
-
-                message = f"，对 {get_card_name(target_minion)} 造成 {card.attack} 点伤害"
-                if target_minion.health <= 0:
-                    opponent.field.remove(target_minion)
-                    message += f"，{get_card_name(target_minion)} 被击败"
-
-                return {
-                    "success": True,
-                    "message": message
-                }
 
-            except (IndexError, ValueError) as e:
-                return {"success": False, "message": f"目标解析错误: {str(e)}"}
-        elif target.startswith("随从") and "_" not in target:
-            # 支持 "随从0" 格式
+        target_idx = parse_minion_target(target)
+        if target_idx is not None:
+            # 支持 "随从_0" 和 "随从0" 两种格式
             try:
-                target_idx = int(target[2:])  # 跳过 "随从"
                 if target_idx >= len(opponent.field):
                     return {"success": False, "message": f"无效的目标随从索引: {target_idx}"}
 
@@ -702,6 +721,7 @@ class CardGame:
         """使用英雄技能"""
         if player_idx != self.current_player_idx:
             return {"success": False, "message": "不是你的回合"}
+        self.turn_version += 1
 
         player = self.players[player_idx]
         if player.mana < 2:
@@ -725,6 +745,7 @@ class CardGame:
         """结束回合"""
         if player_idx != self.current_player_idx:
             return {"success": False, "message": "不是你的回合"}
+        self.turn_version += 1
 
         # 执行战斗阶段（支持自动攻击）
         if auto_attack:
@@ -855,7 +876,7 @@ class CardGame:
                         minion_name = get_card_name(minion)
                         messages.append(f"{minion_name} 攻击英雄 {minion.attack} 点")
                     else:
-                        target_idx = int(target.split("_")[1])
+                        target_idx = parse_minion_target(target)
                         if target_idx < len(opponent.field):
                             target_minion = opponent.field[target_idx]
 
@@ -902,6 +923,7 @@ class CardGame:
         """快速出牌 - 直接使用卡牌索引"""
         if player_idx != self.current_player_idx:
             return {"success": False, "message": "不是你的回合"}
+        self.turn_version += 1
 
         player = self.players[player_idx]
         if card_index >= len(player.hand):
@@ -1119,270 +1141,287 @@ class CardGame:
             }
         }
 
-    def display_status(self, use_rich=True):
-        """显示游戏状态"""
-        from rich.console import Console
+    def build_status_layout(self, state: Optional[Dict[str, Any]] = None):
+        """构建游戏状态的Rich布局
+
+        Args:
+            state: 预先获取的 get_game_state() 快照，为空时重新获取
+        """
         from rich.panel import Panel
         from rich.table import Table
-        from rich.progress import Progress, BarColumn, TextColumn
         from rich.layout import Layout
-        import time
 
-        if use_rich:
-            console = Console()
+        if state is None:
             state = self.get_game_state()
-            current = state["current_player_state"]
-            opponent = state["opponent_state"]
+        current = state["current_player_state"]
+        opponent = state["opponent_state"]
+
+        # 创建主布局
+        layout = Layout()
+        layout.split_column(
+            Layout(name="header", size=3),
+            Layout(name="main"),
+            Layout(name="footer", size=4)  # 增加footer高度
+        )
+
+        # 标题区域
+        header_content = f"[bold cyan]🎮 第 {state['turn_number']} 回合 - {current['name']} 的回合[/bold cyan]"
+        layout["header"].update(Panel(header_content, style="bold blue"))
+
+        # 主区域
+        layout["main"].split_row(
+            Layout(name="player_info", ratio=1),
+            Layout(name="game_area", ratio=2),
+            Layout(name="opponent_info", ratio=1)
+        )
+
+        # 玩家信息
+        player_table = Table(title="👤 玩家状态", show_header=False)
+        player_table.add_column("属性", style="cyan")
+        player_table.add_column("数值", style="green")
+        player_table.add_row("❤️ 生命值", f"{current['health']}/{current['max_health']}")
+        player_table.add_row("💰 法力值", f"{current['mana']}/{current['max_mana']}")
+        player_table.add_row("🃋 手牌", f"{current['hand_count']} 张")
+        player_table.add_row("⚔️ 随从", f"{current['field_count']} 个")
+        layout["player_info"].update(Panel(player_table, border_style="green"))
+
+        # 游戏区域 - 创建手牌、我方场地区域和对手场地区域的布局
+        game_layout = Layout()
+        game_layout.split_column(
+            Layout(name="hand_area", ratio=1),
+            Layout(name="field_section", ratio=1)
+        )
+
+        # 场地区域再分为我方和对手
+        game_layout["field_section"].split_row(
+            Layout(name="player_field", ratio=1),
+            Layout(name="opponent_field", ratio=1)
+        )
+
+        # 手牌显示 - 使用动态宽度
+        if current["hand"]:
+            # 获取终端宽度并计算列宽
+            terminal_width = get_terminal_width()
+
+            # 最终优化列结构
+            min_widths = {
+                "index": 3,    # 编号 - 最简化
+                "name": 12,    # 卡牌名称 - 平衡长度
+                "cost": 2,     # 费用 - 最简化
+                "stats": 6,    # 属性 - 确保emoji可见
+                "playable": 3  # 状态 - 最简化
+            }
+            total_min_width = sum(min_widths.values())
+
+            # 计算实际列宽
+            col_widths = calculate_table_widths(terminal_width, min_widths, total_min_width)
+
+            hand_table = Table(title="🃏 你的手牌", show_header=True)
+            hand_table.add_column("#", style="yellow", justify="right", width=col_widths["index"])
+            hand_table.add_column("卡牌", style="bold white", justify="left", width=col_widths["name"])
+            hand_table.add_column("费", style="blue", justify="center", width=col_widths["cost"])
+            hand_table.add_column("属性", style="red", justify="center", width=col_widths["stats"])
+            hand_table.add_column("状态", style="green", justify="center", width=col_widths["playable"])
+
+            for card in current["hand"]:
+                # 简化状态显示
+                status = "✅" if card["playable"] else "❌"
+
+                # 卡牌类型和机制简短显示
+                card_type = card.get('type', '')
+                type_symbol = "⚔️" if card_type == "minion" else "🔮"  # 随从/法术符号
+
+                # 显示攻击力和血量（随从牌）或效果值（法术牌）
+                if card_type == "minion":
+                    stats = f"[red]{card['attack']}[/red]/[green]{card['health']}[/green]"
+                elif card_type == "spell":
+                    if card['attack'] > 0:
+                        stats = f"[red]🔥{card['attack']}[/red]"  # 伤害法术
+                    elif card['attack'] < 0:
+                        stats = f"[green]💚{-card['attack']}[/green]"  # 治疗法术
+                    else:
+                        stats = "[blue]✨[/blue]"  # 其他法术
+                else:
+                    stats = ""
+
+                # 卡牌名称（包含类型符号）
+                card_name_with_type = f"{type_symbol} {card['name']}"
+                # 使用智能截断确保卡牌名称不会超出列宽
+                card_name_display = truncate_text(card_name_with_type, col_widths["name"] - 2)
+
+                hand_table.add_row(
+                    f"[yellow]{card['index']}[/yellow]",
+                    f"[bold]{card_name_display}[/bold]",
+                    f"[blue]{card['cost']}[/blue]",
+                    stats,  # emoji属性显示
+                    f"[green]{status}[/green]"
+                )
+
+            game_layout["hand_area"].update(Panel(hand_table, border_style="cyan"))
+        else:
+            game_layout["hand_area"].update(Panel("[dim]手牌为空[/dim]", border_style="dim"))
 
-            # 创建主布局
-            layout = Layout()
-            layout.split_column(
-                Layout(name="header", size=3),
-                Layout(name="main"),
-                Layout(name="footer", size=4)  # 增加footer高度
-            )
-
-            # 标题区域
-            header_content = f"[bold cyan]🎮 第 {state['turn_number']} 回合 - {current['name']} 的回合[/bold cyan]"
-            layout["header"].update(Panel(header_content, style="bold blue"))
-
-            # 主区域
-            layout["main"].split_row(
-                Layout(name="player_info", ratio=1),
-                Layout(name="game_area", ratio=2),
-                Layout(name="opponent_info", ratio=1)
-            )
-
-            # 玩家信息
-            player_table = Table(title="👤 玩家状态", show_header=False)
-            player_table.add_column("属性", style="cyan")
-            player_table.add_column("数值", style="green")
-            player_table.add_row("❤️ 生命值", f"{current['health']}/{current['max_health']}")
-            player_table.add_row("💰 法力值", f"{current['mana']}/{current['max_mana']}")
-            player_table.add_row("🃋 手牌", f"{current['hand_count']} 张")
-            player_table.add_row("⚔️ 随从", f"{current['field_count']} 个")
-            layout["player_info"].update(Panel(player_table, border_style="green"))
-
-            # 游戏区域 - 创建手牌、我方场地区域和对手场地区域的布局
-            game_layout = Layout()
-            game_layout.split_column(
-                Layout(name="hand_area", ratio=1),
-                Layout(name="field_section", ratio=1)
-            )
-
-            # 场地区域再分为我方和对手
-            game_layout["field_section"].split_row(
-                Layout(name="player_field", ratio=1),
-                Layout(name="opponent_field", ratio=1)
-            )
-
-            # 手牌显示 - 使用动态宽度
-            if current["hand"]:
-                # 获取终端宽度并计算列宽
+        # 我方场上随从显示 - 使用动态宽度
+        if current["field"]:
+            # 复用已获取的终端宽度
+            if 'terminal_width' not in locals():
                 terminal_width = get_terminal_width()
 
-                # 最终优化列结构
-                min_widths = {
-                    "index": 3,    # 编号 - 最简化
-                    "name": 12,    # 卡牌名称 - 平衡长度
-                    "cost": 2,     # 费用 - 最简化
-                    "stats": 6,    # 属性 - 确保emoji可见
-                    "playable": 3  # 状态 - 最简化
+            # 随从表格的最小列宽
+            field_min_widths = {
+                "index": 6,      # 编号 - 增加宽度确保数字可见
+                "name": 10,      # 随从名称
+                "stats": 6,      # 属性
+                "status": 8,     # 状态
+                "effects": 8     # 特效
+            }
+            field_total_min = sum(field_min_widths.values())
+
+            # 计算随从表格的实际列宽
+            field_col_widths = calculate_table_widths(terminal_width, field_min_widths, field_total_min)
+
+            player_field_table = Table(title="⚔️ 你的随从", show_header=True)
+            player_field_table.add_column("编号", style="yellow", width=field_col_widths["index"], justify="right")
+            player_field_table.add_column("随从", style="bold white", width=field_col_widths["name"], justify="left")
+            player_field_table.add_column("属性", style="red", width=field_col_widths["stats"], justify="center")
+            player_field_table.add_column("状态", style="green", width=field_col_widths["status"], justify="center")
+            player_field_table.add_column("特效", style="blue", width=field_col_widths["effects"], justify="center")
+
+            for i, card in enumerate(current["field"]):
+                # 确保随从有正确的攻击状态
+                ensure_minion_attack_state(card)
+
+                # 攻击状态
+                can_attack = get_minion_can_attack(card, False)
+                attack_status = "[green]⚔️可攻击[/green]" if can_attack else "[red]😴休眠[/red]"
+
+                # 特效标记
+                mechanics_map = {
+                    "taunt": "🛡️嘲讽",
+                    "divine_shield": "✨圣盾",
+                    "stealth": "🌑潜行",
+                    "ranged": "🏹远程",
+                    "spell_power": "🔥法强"
                 }
-                total_min_width = sum(min_widths.values())
-
-                # 计算实际列宽
-                col_widths = calculate_table_widths(terminal_width, min_widths, total_min_width)
+                mechanics_display = " ".join([mechanics_map.get(m, m) for m in card.get('mechanics', [])])
 
-                hand_table = Table(title="🃏 你的手牌", show_header=True)
-                hand_table.add_column("#", style="yellow", justify="right", width=col_widths["index"])
-                hand_table.add_column("卡牌", style="bold white", justify="left", width=col_widths["name"])
-                hand_table.add_column("费", style="blue", justify="center", width=col_widths["cost"])
-                hand_table.add_column("属性", style="red", justify="center", width=col_widths["stats"])
-                hand_table.add_column("状态", style="green", justify="center", width=col_widths["playable"])
+                # 使用智能截断确保内容不会超出列宽
+                minion_name_display = truncate_text(get_card_name(card), field_col_widths["name"] - 2)
+                mechanics_display_truncated = truncate_text(mechanics_display or "无", field_col_widths["effects"])
 
-                for card in current["hand"]:
-                    # 简化状态显示
-                    status = "✅" if card["playable"] else "❌"
+                player_field_table.add_row(
+                    f"[yellow]{i}[/yellow]",
+                    f"[bold]{minion_name_display}[/bold]",
+                    f"[red]{get_card_attack(card)}[/red]/[green]{get_card_health(card)}[/green]",
+                    attack_status,
+                    f"[blue]{mechanics_display_truncated}[/blue]" if mechanics_display else "[dim]无[/dim]"
+                )
 
-                    # 卡牌类型和机制简短显示
-                    card_type = card.get('type', '')
-                    type_symbol = "⚔️" if card_type == "minion" else "🔮"  # 随从/法术符号
-
-                    # 显示攻击力和血量（随从牌）或效果值（法术牌）
-                    if card_type == "minion":
-                        stats = f"[red]{card['attack']}[/red]/[green]{card['health']}[/green]"
-                    elif card_type == "spell":
-                        if card['attack'] > 0:
-                            stats = f"[red]🔥{card['attack']}[/red]"  # 伤害法术
-                        elif card['attack'] < 0:
-                            stats = f"[green]💚{-card['attack']}[/green]"  # 治疗法术
-                        else:
-                            stats = "[blue]✨[/blue]"  # 其他法术
-                    else:
-                        stats = ""
-
-                    # 卡牌名称（包含类型符号）
-                    card_name_with_type = f"{type_symbol} {card['name']}"
-                    # 使用智能截断确保卡牌名称不会超出列宽
-                    card_name_display = truncate_text(card_name_with_type, col_widths["name"] - 2)
-
-                    hand_table.add_row(
-                        f"[yellow]{card['index']}[/yellow]",
-                        f"[bold]{card_name_display}[/bold]",
-                        f"[blue]{card['cost']}[/blue]",
-                        stats,  # emoji属性显示
-                        f"[green]{status}[/green]"
-                    )
-
-                game_layout["hand_area"].update(Panel(hand_table, border_style="cyan"))
-            else:
-                game_layout["hand_area"].update(Panel("[dim]手牌为空[/dim]", border_style="dim"))
+            game_layout["player_field"].update(Panel(player_field_table, border_style="green"))
+        else:
+            game_layout["player_field"].update(Panel("[dim]场上没有随从[/dim]", border_style="dim"))
 
-            # 我方场上随从显示 - 使用动态宽度
-            if current["field"]:
-                # 复用已获取的终端宽度
-                if 'terminal_width' not in locals():
-                    terminal_width = get_terminal_width()
-
-                # 随从表格的最小列宽
-                field_min_widths = {
-                    "index": 6,      # 编号 - 增加宽度确保数字可见
-                    "name": 10,      # 随从名称
-                    "stats": 6,      # 属性
-                    "status": 8,     # 状态
-                    "effects": 8     # 特效
+        # 对手场上随从显示 - 使用动态宽度
+        if opponent["field"]:
+            # 复用已获取的终端宽度和列宽配置
+            if 'terminal_width' not in locals():
+                terminal_width = get_terminal_width()
+            field_min_widths = {
+                "index": 6, "name": 10, "stats": 6, "status": 8, "effects": 8
+            }
+            field_total_min = sum(field_min_widths.values())
+            field_col_widths = calculate_table_widths(terminal_width, field_min_widths, field_total_min)
+
+            opponent_field_table = Table(title="🤖 对手随从", show_header=True)
+            opponent_field_table.add_column("编号", style="yellow", width=field_col_widths["index"], justify="right")
+            opponent_field_table.add_column("随从", style="bold white", width=field_col_widths["name"], justify="left")
+            opponent_field_table.add_column("属性", style="red", width=field_col_widths["stats"], justify="center")
+            opponent_field_table.add_column("状态", style="red", width=field_col_widths["status"], justify="center")
+            opponent_field_table.add_column("特效", style="blue", width=field_col_widths["effects"], justify="center")
+
+            for i, card in enumerate(opponent["field"]):
+                # 对手随从状态 - 简化显示，只显示是否可攻击（潜行等特殊状态）
+                can_attack = get_minion_can_attack(card, False)
+                attack_status = "[red]⚔️可攻击[/red]" if can_attack else "[dim]😴休眠[/dim]"
+
+                # 特效标记
+                mechanics_map = {
+                    "taunt": "🛡️嘲讽",
+                    "divine_shield": "✨圣盾",
+                    "stealth": "🌑潜行",
+                    "ranged": "🏹远程",
+                    "spell_power": "🔥法强"
                 }
-                field_total_min = sum(field_min_widths.values())
+                mechanics_display = " ".join([mechanics_map.get(m, m) for m in card.get('mechanics', [])])
 
-                # 计算随从表格的实际列宽
-                field_col_widths = calculate_table_widths(terminal_width, field_min_widths, field_total_min)
+                # 使用智能截断确保内容不会超出列宽
+                minion_name_display = truncate_text(get_card_name(card), field_col_widths["name"] - 2)
+                mechanics_display_truncated = truncate_text(mechanics_display or "无", field_col_widths["effects"])
 
-                player_field_table = Table(title="⚔️ 你的随从", show_header=True)
-                player_field_table.add_column("编号", style="yellow", width=field_col_widths["index"], justify="right")
-                player_field_table.add_column("随从", style="bold white", width=field_col_widths["name"], justify="left")
-                player_field_table.add_column("属性", style="red", width=field_col_widths["stats"], justify="center")
-                player_field_table.add_column("状态", style="green", width=field_col_widths["status"], justify="center")
-                player_field_table.add_column("特效", style="blue", width=field_col_widths["effects"], justify="center")
+                opponent_field_table.add_row(
+                    f"[yellow]{i}[/yellow]",
+                    f"[bold]{minion_name_display}[/bold]",
+                    f"[red]{get_card_attack(card)}[/red]/[green]{get_card_health(card)}[/green]",
+                    attack_status,
+                    f"[blue]{mechanics_display_truncated}[/blue]" if mechanics_display else "[dim]无[/dim]"
+                )
 
-                for i, card in enumerate(current["field"]):
-                    # 确保随从有正确的攻击状态
-                    ensure_minion_attack_state(card)
-
-                    # 攻击状态
-                    can_attack = get_minion_can_attack(card, False)
-                    attack_status = "[green]⚔️可攻击[/green]" if can_attack else "[red]😴休眠[/red]"
-
-                    # 特效标记
-                    mechanics_map = {
-                        "taunt": "🛡️嘲讽",
-                        "divine_shield": "✨圣盾",
-                        "stealth": "🌑潜行",
-                        "ranged": "🏹远程",
-                        "spell_power": "🔥法强"
-                    }
-                    mechanics_display = " ".join([mechanics_map.get(m, m) for m in card.get('mechanics', [])])
-
-                    # 使用智能截断确保内容不会超出列宽
-                    minion_name_display = truncate_text(get_card_name(card), field_col_widths["name"] - 2)
-                    mechanics_display_truncated = truncate_text(mechanics_display or "无", field_col_widths["effects"])
-
-                    player_field_table.add_row(
-                        f"[yellow]{i}[/yellow]",
-                        f"[bold]{minion_name_display}[/bold]",
-                        f"[red]{get_card_attack(card)}[/red]/[green]{get_card_health(card)}[/green]",
-                        attack_status,
-                        f"[blue]{mechanics_display_truncated}[/blue]" if mechanics_display else "[dim]无[/dim]"
-                    )
-
-                game_layout["player_field"].update(Panel(player_field_table, border_style="green"))
-            else:
-                game_layout["player_field"].update(Panel("[dim]场上没有随从[/dim]", border_style="dim"))
+            game_layout["opponent_field"].update(Panel(opponent_field_table, border_style="red"))
+        else:
+            game_layout["opponent_field"].update(Panel("[dim]对手没有随从[/dim]", border_style="dim"))
 
-            # 对手场上随从显示 - 使用动态宽度
-            if opponent["field"]:
-                # 复用已获取的终端宽度和列宽配置
-                if 'terminal_width' not in locals():
-                    terminal_width = get_terminal_width()
-                field_min_widths = {
-                    "index": 6, "name": 10, "stats": 6, "status": 8, "effects": 8
-                }
-                field_total_min = sum(field_min_widths.values())
-                field_col_widths = calculate_table_widths(terminal_width, field_min_widths, field_total_min)
+        layout["game_area"].update(Panel(game_layout, border_style="blue"))
 
-                opponent_field_table = Table(title="🤖 对手随从", show_header=True)
-                opponent_field_table.add_column("编号", style="yellow", width=field_col_widths["index"], justify="right")
-                opponent_field_table.add_column("随从", style="bold white", width=field_col_widths["name"], justify="left")
-                opponent_field_table.add_column("属性", style="red", width=field_col_widths["stats"], justify="center")
-                opponent_field_table.add_column("状态", style="red", width=field_col_widths["status"], justify="center")
-                opponent_field_table.add_column("特效", style="blue", width=field_col_widths["effects"], justify="center")
+        # 对手信息
+        opponent_table = Table(title="🤖 对手状态", show_header=False)
+        opponent_table.add_column("属性", style="red")
+        opponent_table.add_column("数值", style="yellow")
+        opponent_table.add_row("❤️ 生命值", f"{opponent['health']}/{opponent['max_health']}")
+        opponent_table.add_row("💰 法力值", f"{opponent['mana']}/{opponent['max_mana']}")
+        opponent_table.add_row("🃋 手牌", f"{opponent['hand_count']} 张")
+        opponent_table.add_row("⚔️ 随从", f"{opponent['field_count']} 个")
+        layout["opponent_info"].update(Panel(opponent_table, border_style="red"))
 
-                for i, card in enumerate(opponent["field"]):
-                    # 对手随从状态 - 简化显示，只显示是否可攻击（潜行等特殊状态）
-                    can_attack = get_minion_can_attack(card, False)
-                    attack_status = "[red]⚔️可攻击[/red]" if can_attack else "[dim]😴休眠[/dim]"
+        # 底部 - 带智能截断检测的操作提示
+        hints = self.get_simple_input_hints()
 
-                    # 特效标记
-                    mechanics_map = {
-                        "taunt": "🛡️嘲讽",
-                        "divine_shield": "✨圣盾",
-                        "stealth": "🌑潜行",
-                        "ranged": "🏹远程",
-                        "spell_power": "🔥法强"
-                    }
-                    mechanics_display = " ".join([mechanics_map.get(m, m) for m in card.get('mechanics', [])])
-
-                    # 使用智能截断确保内容不会超出列宽
-                    minion_name_display = truncate_text(get_card_name(card), field_col_widths["name"] - 2)
-                    mechanics_display_truncated = truncate_text(mechanics_display or "无", field_col_widths["effects"])
-
-                    opponent_field_table.add_row(
-                        f"[yellow]{i}[/yellow]",
-                        f"[bold]{minion_name_display}[/bold]",
-                        f"[red]{get_card_attack(card)}[/red]/[green]{get_card_health(card)}[/green]",
-                        attack_status,
-                        f"[blue]{mechanics_display_truncated}[/blue]" if mechanics_display else "[dim]无[/dim]"
-                    )
-
-                game_layout["opponent_field"].update(Panel(opponent_field_table, border_style="red"))
+        # 检测提示是否被截断
+        try:
+            import shutil
+            terminal_width = shutil.get_terminal_size().columns
+            # 如果提示文本接近终端宽度，添加省略号提示
+            if len(hints) > terminal_width - 8:
+                hint_text = f"[green]{hints}[/green] [dim](输入 'h' 查看完整帮助)[/dim]"
             else:
-                game_layout["opponent_field"].update(Panel("[dim]对手没有随从[/dim]", border_style="dim"))
-
-            layout["game_area"].update(Panel(game_layout, border_style="blue"))
-
-            # 对手信息
-            opponent_table = Table(title="🤖 对手状态", show_header=False)
-            opponent_table.add_column("属性", style="red")
-            opponent_table.add_column("数值", style="yellow")
-            opponent_table.add_row("❤️ 生命值", f"{opponent['health']}/{opponent['max_health']}")
-            opponent_table.add_row("💰 法力值", f"{opponent['mana']}/{opponent['max_mana']}")
-            opponent_table.add_row("🃋 手牌", f"{opponent['hand_count']} 张")
-            opponent_table.add_row("⚔️ 随从", f"{opponent['field_count']} 个")
-            layout["opponent_info"].update(Panel(opponent_table, border_style="red"))
-
-            # 底部 - 带智能截断检测的操作提示
-            hints = self.get_simple_input_hints()
-
-            # 检测提示是否被截断
-            try:
-                import shutil
-                terminal_width = shutil.get_terminal_size().columns
-                # 如果提示文本接近终端宽度，添加省略号提示
-                if len(hints) > terminal_width - 8:
-                    hint_text = f"[green]{hints}[/green] [dim](输入 'h' 查看完整帮助)[/dim]"
-                else:
-                    hint_text = f"[green]{hints}[/green]"
-            except:
                 hint_text = f"[green]{hints}[/green]"
+        except:
+            hint_text = f"[green]{hints}[/green]"
+
+        # 使用更紧凑的Panel配置，减少边距
+        footer_panel = Panel(
+            hint_text,
+            style="dim green",
+            padding=(0, 1),  # 上下0，左右1的边距
+            border_style="dim"
+        )
+        layout["footer"].update(footer_panel)
+
+        return layout
+
+    def display_status(self, use_rich=True, layout=None, state=None):
+        """显示游戏状态
+
+        Args:
+            use_rich: 是否使用Rich界面
+            layout: 预先构建的状态布局，为空时重新构建
+            state: 预先获取的 get_game_state() 快照，为空时重新获取
+        """
+        if use_rich:
+            from rich.console import Console
 
-            # 使用更紧凑的Panel配置，减少边距
-            footer_panel = Panel(
-                hint_text,
-                style="dim green",
-                padding=(0, 1),  # 上下0，左右1的边距
-                border_style="dim"
-            )
-            layout["footer"].update(footer_panel)
+            console = Console()
+            if layout is None:
+                layout = self.build_status_layout(state)
 
             # 显示界面
             console.clear()
@@ -1390,7 +1429,8 @@ class CardGame:
 
         else:
             # 原始文本模式
-            state = self.get_game_state()
+            if state is None:
+                state = self.get_game_state()
             current = state["current_player_state"]
             opponent = state["opponent_state"]
 
@@ -1686,24 +1726,48 @@ class CardGame:
 
         return targets
 
-    def attack_with_minion(self, player_idx: int, minion_idx: int, target: str) -> Dict[str, Any]:
-        """随从攻击"""
+    def _quick_validate_attack(self, player_idx: int, minion_idx: int, target: str) -> Optional[str]:
+        """
+        攻击前的快速校验，只检查回合、编号范围、攻击状态和目标格式
+
+        Returns:
+            错误信息，校验通过时返回None
+        """
         if player_idx != self.current_player_idx:
-            return {"success": False, "message": "不是你的回合"}
+            return "不是你的回合"
 
         current = self.players[player_idx]
-        opponent = self.players[1 - player_idx]
-
         if minion_idx >= len(current.field):
-            return {"success": False, "message": "无效的随从编号"}
-
-        minion = current.field[minion_idx]
+            return "无效的随从编号"
 
         # 检查随从是否可以攻击
-        if not get_minion_can_attack(minion, False):
-            return {"success": False, "message": "该随从本回合无法攻击"}
+        if not get_minion_can_attack(current.field[minion_idx], False):
+            return "该随从本回合无法攻击"
+
+        if target == "英雄":
+            return None
+
+        target_idx = parse_minion_target(target)
+        if target_idx is None:
+            return "无效的攻击目标"
+        if target_idx >= len(self.players[1 - player_idx].field):
+            return "无效的目标编号"
+        return None
+
+    def attack_with_minion(self, player_idx: int, minion_idx: int, target: str) -> Dict[str, Any]:
+        """随从攻击"""
+        # 先做廉价校验，非法的攻击指令不进入战斗结算
+        error = self._quick_validate_attack(player_idx, minion_idx, target)
+        if error is not None:
+            return {"success": False, "message": error}
+        self.turn_version += 1
+
+        current = self.players[player_idx]
+        opponent = self.players[1 - player_idx]
+        minion = current.field[minion_idx]
 
         # 解析攻击目标
+        target_idx = None if target == "英雄" else parse_minion_target(target)
         if target == "英雄":
             # 攻击英雄
             opponent.health -= minion.attack
@@ -1714,12 +1778,8 @@ class CardGame:
 
             logger.info(f"  ⚔️ {result_message}")
 
-        elif target.startswith("随从_"):
+        else:
             try:
-                target_idx = int(target.split("_")[1])
-                if target_idx >= len(opponent.field):
-                    return {"success": False, "message": "无效的目标编号"}
-
                 target_minion = opponent.field[target_idx]
 
                 # 检查是否必须攻击嘲讽
@@ -1767,8 +1827,6 @@ class CardGame:
 
             except (IndexError, ValueError):
                 return {"success": False, "message": "目标格式错误"}
-        else:
-            return {"success": False, "message": "无效的攻击目标"}
 
         # 检查游戏结束
         self._check_game_over()
@@ -1798,6 +1856,7 @@ class CardGame:
         """英雄攻击"""
         if player_idx != self.current_player_idx:
             return {"success": False, "message": "不是你的回合"}
+        self.turn_version += 1
 
         current = self.players[player_idx]
         opponent = self.players[1 - player_idx]
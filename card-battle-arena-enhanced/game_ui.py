@@ -4,6 +4,7 @@ Card Battle Arena Enhanced - 炫酷动画界面
 使用Rich库创建动态、美观的终端游戏界面
 """
 import asyncio
+import threading
 import time
 import random
 from rich.console import Console
@@ -1357,6 +1358,15 @@ from rich.layout import Layout
 from typing import Any, Tuple, Optional, Union
 
 
+def _freeze_layout_input(value):
+    """把布局输入逐层复制成可比较的元组，快照不与调用方的可变对象共享任何层级"""
+    if isinstance(value, dict):
+        return tuple((key, _freeze_layout_input(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze_layout_input(item) for item in value)
+    return value
+
+
 class GameLayout:
     """基于Rich Layout的游戏界面布局管理器"""
 
@@ -1369,6 +1379,8 @@ class GameLayout:
     def _create_layout(self):
         """创建基础Layout结构"""
         self.layout = Layout()
+        # 各区域上次更新时的输入快照，输入未变化时跳过组件重建
+        self._area_inputs = {}
 
         # 主要垂直分割：上部游戏信息区，下部交互区
         self.layout.split_column(
@@ -1407,28 +1419,54 @@ class GameLayout:
             self.layout_mode = "horizontal"
             # 保持当前水平布局
 
+    def _area_unchanged(self, area: str, *inputs) -> bool:
+        """输入与上次相同时返回True，否则记录新快照并返回False
+
+        快照把输入（包括嵌套的列表和字典）逐层复制成元组，并带上终端宽度，
+        调用方原地修改任意层级的状态或终端尺寸变化后都会重建组件。
+        """
+        snapshot = (self.console.width, _freeze_layout_input(inputs))
+        if self._area_inputs.get(area) == snapshot:
+            return True
+        self._area_inputs[area] = snapshot
+        return False
+
     def update_player_status(self, player_data: dict):
         """更新玩家状态区域"""
+        if not isinstance(player_data, dict):
+            raise TypeError(f"玩家状态数据必须是字典，实际为 {type(player_data).__name__}")
+        if self._area_unchanged("player_status", player_data):
+            return
         panel = create_player_status_panel(player_data)
         self.layout["player_status"].update(panel)
 
     def update_opponent_status(self, opponent_data: dict):
         """更新对手状态区域"""
+        if not isinstance(opponent_data, dict):
+            raise TypeError(f"对手状态数据必须是字典，实际为 {type(opponent_data).__name__}")
+        if self._area_unchanged("opponent_status", opponent_data):
+            return
         panel = create_opponent_status_panel(opponent_data)
         self.layout["opponent_status"].update(panel)
 
     def update_hand_area(self, hand_cards: list, current_mana: int):
         """更新手牌区域"""
+        if self._area_unchanged("hand_area", hand_cards, current_mana):
+            return
         table = create_hand_cards_table(hand_cards, current_mana)
         self.layout["hand_area"].update(table)
 
     def update_battlefield_area(self, player_field: list, opponent_field: list):
         """更新战场区域"""
+        if self._area_unchanged("battlefield_area", player_field, opponent_field):
+            return
         component = create_battlefield_component(player_field, opponent_field)
         self.layout["battlefield_area"].update(component)
 
     def update_command_area(self, available_actions: list = None):
         """更新命令区域"""
+        if self._area_unchanged("command_area", available_actions):
+            return
         panel = create_command_panel(available_actions)
         self.layout["command_area"].update(panel)
 
@@ -1443,13 +1481,19 @@ class GameLayout:
 class GameUIWithLive:
     """带Live渲染功能的游戏UI（修复版本，支持用户交互）"""
 
+    REFRESH_PER_SECOND = 4  # 状态连续变化时的最高刷新率
+
     def __init__(self):
         self.layout_manager = GameLayout()
         self.live = None
         self.game_state = {}
         self._is_running = False
         self._last_update_time = 0
-        self._min_update_interval = 0.1  # 最小更新间隔（秒）
+        # 脏标记：状态更新只做标记，由Live刷新线程在下一帧统一重建组件
+        self._dirty = False
+        # 状态变化事件：刷新线程空闲时阻塞等待，不按固定帧率轮询重绘
+        self._changed = threading.Event()
+        self._refresh_thread = None
         self._input_handler = UserInputHandler()
 
     def start_rendering(self):
@@ -1461,16 +1505,18 @@ class GameUIWithLive:
         import time
 
         self.live = Live(
-            self.layout_manager.layout,
             console=self.layout_manager.console,
-            refresh_per_second=4,  # 提高刷新率减少闪烁
+            refresh_per_second=self.REFRESH_PER_SECOND,
             transient=False,  # 防止闪烁
-            auto_refresh=True  # 自动刷新
+            auto_refresh=False,  # 由 _refresh_loop 在状态变化时刷新
+            get_renderable=self._get_renderable  # 每帧取渲染内容，合并两帧之间的多次更新
         )
 
         try:
             self.live.start()
             self._is_running = True
+            self._refresh_thread = threading.Thread(target=self._refresh_loop, daemon=True)
+            self._refresh_thread.start()
 
             # 启动后立即刷新一次显示内容
             if self.game_state:
@@ -1485,15 +1531,34 @@ class GameUIWithLive:
         # 这个方法会被Live自动调用，不需要手动实现
         pass
 
+    def _refresh_loop(self) -> None:
+        """刷新线程：等待状态变化后刷新一帧，帧间隔内到达的多次更新合并渲染"""
+        interval = 1 / self.REFRESH_PER_SECOND
+        while self._is_running:
+            self._changed.wait()
+            self._changed.clear()
+            if not self._is_running:
+                break
+            try:
+                self.live.refresh()
+            except Exception:
+                pass
+            time.sleep(interval)
+
+    def _get_renderable(self):
+        """Live每帧调用：状态有变化时才重建组件，两帧之间的多次更新只渲染一次"""
+        if self._dirty:
+            # 先清标记再渲染，渲染期间到达的更新会留到下一帧
+            self._dirty = False
+            self._render_all_components()
+        return self.layout_manager.layout
+
     def _force_refresh(self):
         """强制刷新显示内容"""
         if hasattr(self, 'live') and self.live:
             try:
-                # 更新所有组件内容
-                if self.game_state:
-                    self._render_all_components()
-
-                # 立即刷新Live显示
+                # 标记组件需要重建，并立即刷新Live显示
+                self._dirty = True
                 self.live.refresh()
             except Exception as e:
                 self.layout_manager.console.print(f"[red]❌ 强制刷新失败: {e}[/red]")
@@ -1531,19 +1596,18 @@ class GameUIWithLive:
             self.layout_manager.console.print(f"[red]❌ 渲染组件失败: {e}[/red]")
 
     def update_game_state(self, game_state: dict):
-        """更新游戏状态并重新渲染（带节流）"""
+        """
+        更新游戏状态并标记需要重新渲染
+
+        组件不在这里重建，而是唤醒刷新线程按帧率合并渲染（见 _refresh_loop），
+        连续快速更新时只渲染最新状态，也不会丢掉最后一次更新
+        """
         import time
 
         # 总是更新游戏状态，即使Live没有启动
         if not game_state:
             return
 
-        # 节流：避免过于频繁的更新（仅在Live运行时）
-        if self._is_running and self.live:
-            current_time = time.time()
-            if current_time - self._last_update_time < self._min_update_interval:
-                return
-
         try:
             # 检查状态是否真的发生了变化（仅在Live运行时）
             if self._is_running and not self._has_state_changed(game_state):
@@ -1551,33 +1615,9 @@ class GameUIWithLive:
 
             # 总是更新内部游戏状态
             self.game_state = game_state.copy()  # 深拷贝避免引用问题
-
-            # 仅在Live运行时更新UI组件
-            if self._is_running and self.live:
-                # 更新各个区域
-                if "player" in game_state:
-                    self.layout_manager.update_player_status(game_state["player"])
-
-                if "opponent" in game_state:
-                    self.layout_manager.update_opponent_status(game_state["opponent"])
-
-                if "hand" in game_state and "player" in game_state:
-                    self.layout_manager.update_hand_area(
-                        game_state["hand"],
-                        game_state["player"].get("mana", 0)
-                    )
-
-                if "battlefield" in game_state:
-                    self.layout_manager.update_battlefield_area(
-                        game_state["battlefield"].get("player", []),
-                        game_state["battlefield"].get("opponent", [])
-                    )
-
-                # 更新命令区域
-                available_commands = self._get_available_commands(game_state)
-                self.layout_manager.update_command_area(available_commands)
-
-                self._last_update_time = time.time()
+            self._dirty = True
+            self._last_update_time = time.time()
+            self._changed.set()
 
         except Exception as e:
             self.layout_manager.console.print(f"[red]❌ 更新游戏状态失败: {e}[/red]")
@@ -1638,8 +1678,13 @@ class GameUIWithLive:
         """停止Live渲染"""
         if self.live and self._is_running:
             try:
-                self.live.stop()
+                # 先唤醒并结束刷新线程，再停止Live
                 self._is_running = False
+                self._changed.set()
+                if self._refresh_thread:
+                    self._refresh_thread.join()
+                    self._refresh_thread = None
+                self.live.stop()
             except Exception as e:
                 self.layout_manager.console.print(f"[yellow]⚠️ 停止Live时出错: {e}[/yellow]")
             finally:
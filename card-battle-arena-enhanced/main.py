@@ -8,6 +8,7 @@ import argparse
 import logging
 import sys
 import random
+import time
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional
 
@@ -1731,9 +1732,9 @@ async def run_benchmark(args):
             success_count = 0
 
             for i in range(test_count):
-                start_time = asyncio.get_event_loop().time()
+                start_time = time.perf_counter()
                 action = await engine.make_decision(context)
-                end_time = asyncio.get_event_loop().time()
+                end_time = time.perf_counter()
 
                 if action:
                     success_count += 1
@@ -7,6 +7,7 @@
 import sys
 import os
 import asyncio
+import time
 from pathlib import Path
 
 # 添加项目根目录到Python路径
@@ -95,12 +96,12 @@ async def test_ai_decision_engine():
 
         # 测试AI决策
         console.print(f"\n🤖 [magenta]AI决策测试开始...[/magenta]")
-        start_time = asyncio.get_event_loop().time()
+        start_time = time.perf_counter()
 
         # 使用AI代理的决策方法
         action = ai_agent.decide_action(game.players[1], game)
 
-        end_time = asyncio.get_event_loop().time()
+        end_time = time.perf_counter()
         elapsed_time = end_time - start_time
 
         if action:
@@ -6,6 +6,7 @@
 import sys
 import os
 import asyncio
+import time
 
 # 添加项目根目录到Python路径
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -94,13 +95,13 @@ async def test_ai_decision():
     
     # 测试AI决策
     console.print(f"\n[bold magenta]AI开始决策...[/bold magenta]")
-    start_time = asyncio.get_event_loop().time()
+    start_time = time.perf_counter()
     
     try:
         # 使用AI代理的决策方法
         action = ai_agent.decide_action(game.players[1], game)
         
-        end_time = asyncio.get_event_loop().time()
+        end_time = time.perf_counter()
         elapsed_time = end_time - start_time
         
         if action:
@@ -114,7 +115,7 @@ async def test_ai_decision():
             console.print(f"  耗时: {elapsed_time:.2f}秒")
             
     except Exception as e:
-        end_time = asyncio.get_event_loop().time()
+        end_time = time.perf_counter()
         elapsed_time = end_time - start_time
         console.print(f"[bold red]💥 AI决策出错: {e}[/bold red]")
         console.print(f"  耗时: {elapsed_time:.2f}秒")
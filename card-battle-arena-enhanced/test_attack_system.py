@@ -6,7 +6,7 @@
 
 import asyncio
 from game_ui import GameUIStatic
-from game_engine.card_game import CardGame
+from game_engine.card_game import CardGame, Card, parse_minion_target
 
 def test_attack_state_management():
     """测试攻击状态管理"""
@@ -238,6 +238,65 @@ def test_attack_target_parsing():
         print(f"   ❌ 普通目标解析异常: 期望 {expected_targets}, 实际 {available_targets}")
         return False
 
+def test_minion_target_string_parsing():
+    """测试随从目标字符串解析"""
+    print("\n🧪 测试随从目标字符串解析...")
+
+    cases = {
+        "随从_0": 0,
+        "随从_6": 6,
+        "随从3": 3,
+        "随从_40": 40,
+        "英雄": None,
+        "随从_": None,
+        "随从_x": None,
+    }
+
+    for target, expected in cases.items():
+        actual = parse_minion_target(target)
+        if actual != expected:
+            print(f"   ❌ {target} 解析异常: 期望 {expected}, 实际 {actual}")
+            return False
+
+    print(f"   ✅ {len(cases)} 种目标格式解析正常")
+    return True
+
+
+def test_invalid_attack_rejected_early():
+    """测试非法攻击指令在战斗结算前被拒绝"""
+    print("\n🧪 测试非法攻击指令快速拒绝...")
+
+    game = CardGame("测试玩家", "测试对手")
+    attacker = Card("狼人", 3, 3, 2, "minion")
+    attacker.can_attack = True
+    game.players[0].field.append(attacker)
+    game.players[1].field.append(Card("石像鬼", 1, 1, 1, "minion"))
+
+    cases = [
+        ("hero", "无效的攻击目标"),
+        ("minion_0", "无效的攻击目标"),
+        ("随从_5", "无效的目标编号"),
+    ]
+    version = game.turn_version
+    for target, expected in cases:
+        result = game.attack_with_minion(0, 0, target)
+        if result["success"] or result["message"] != expected:
+            print(f"   ❌ {target} 处理异常: {result}")
+            return False
+
+    if game.turn_version != version or not attacker.can_attack:
+        print("   ❌ 非法攻击改变了游戏状态")
+        return False
+
+    result = game.attack_with_minion(0, 0, "随从_0")
+    if not result["success"]:
+        print(f"   ❌ 合法攻击失败: {result['message']}")
+        return False
+
+    print(f"   ✅ {len(cases)} 种非法目标被快速拒绝，合法攻击正常结算")
+    return True
+
+
 async def test_attack_command_processing():
     """测试攻击命令处理"""
     print("\n🧪 测试攻击命令处理...")
@@ -304,6 +363,8 @@ def main():
     test_results.append(("AI攻击功能", test_ai_attack_functionality()))
     test_results.append(("玩家攻击命令", test_player_attack_commands()))
     test_results.append(("攻击目标解析", test_attack_target_parsing()))
+    test_results.append(("随从目标字符串解析", test_minion_target_string_parsing()))
+    test_results.append(("非法攻击快速拒绝", test_invalid_attack_rejected_early()))
     test_results.append(("攻击命令处理", asyncio.run(test_attack_command_processing())))
 
     # 显示测试结果总结
@@ -169,13 +169,67 @@ async def test_backward_compatibility():
     return True
 
 
+async def test_queued_inputs():
+    """测试并发输入经队列按顺序处理"""
+    print("\n🧪 输入队列测试")
+    print("=" * 50)
+
+    game = CardGame("队列测试玩家", "队列测试AI")
+    ui = GameUI()
+    ui.console = MockConsole()
+    command_integration = create_command_integration(game, ui)
+
+    commands = ["help", "status", "invalid_command", "help"]
+    results = await asyncio.gather(*(
+        command_integration.process_user_input(cmd, 0) for cmd in commands
+    ))
+
+    for cmd, (success, message, data) in zip(commands, results):
+        print(f"   {cmd}: {'成功' if success else '失败'} - {message}")
+
+    assert [success for success, _, _ in results] == [True, True, False, True]
+    assert results[2][1] == "未知命令: invalid_command"
+
+    # 命令处理过程中再次提交输入不会等待自己的队列而死锁
+    original_process = command_integration.processor.process_command
+
+    async def reentrant_process(context):
+        if context.command_text == "nested":
+            return await command_integration.process_user_input("help", context.player_idx)
+        return await original_process(context)
+
+    command_integration.processor.process_command = reentrant_process
+    success, message, data = await asyncio.wait_for(
+        command_integration.process_user_input("nested", 0), timeout=5
+    )
+    print(f"   嵌套输入: {'成功' if success else '失败'}")
+    assert success
+
+    # 消费任务停止时，处理中和排队中的输入都会失败而不是一直等待
+    async def blocking_process(context):
+        await asyncio.Event().wait()
+
+    command_integration.processor.process_command = blocking_process
+    waiting = [asyncio.create_task(command_integration.process_user_input("help", 0)) for _ in range(3)]
+    await asyncio.sleep(0.01)
+    await command_integration.close()
+    outcomes = await asyncio.wait_for(asyncio.gather(*waiting, return_exceptions=True), timeout=5)
+    print(f"   停止后未完成输入: {[type(o).__name__ for o in outcomes]}")
+    assert all(isinstance(o, RuntimeError) for o in outcomes)
+
+    await command_integration.close()
+    print(f"\n🎉 输入队列测试完成！")
+    return True
+
+
 if __name__ == "__main__":
     async def main():
         try:
             success1 = await test_complete_integration()
             success2 = await test_backward_compatibility()
+            success3 = await test_queued_inputs()
 
-            if success1 and success2:
+            if success1 and success2 and success3:
                 print("\n🎉 所有集成测试通过！统一命令处理架构工作正常。")
                 print("✅ 新系统与现有系统完全兼容")
                 print("✅ 命令处理逻辑已统一")
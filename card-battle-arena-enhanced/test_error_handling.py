@@ -52,6 +52,20 @@ async def test_basic_error_handling():
     print(f"   消息长度: {len(message)} 字符")
     print(f"   包含建议: {'是' if '建议' in message else '否'}")
 
+    # 测试4: 模板键在首次格式化后缓存
+    print("\n🎯 测试4: 模板键缓存")
+    print("-" * 30)
+
+    error_info = handle_error(
+        exception=ValueError("Not enough mana"),
+        category=ErrorCategory.GAME_STATE,
+        title="游戏状态错误"
+    )
+    first = format_error_feedback(error_info)
+    print(f"   模板键: {error_info.template_key}")
+    assert error_info.template_key == "insufficient_mana", "应匹配法力不足模板"
+    assert format_error_feedback(error_info) == first, "重复格式化结果应一致"
+
     print("\n🎉 基础错误处理测试完成！")
     return True
 
@@ -81,6 +95,25 @@ async def test_error_decorators():
     print(f"   除零错误处理: {result}")
     print(f"   返回默认值0: {'是' if result == 0 else '否'}")
 
+    @safe_execute(default_return=None)
+    def process_big_state(state):
+        raise RuntimeError("大参数测试错误")
+
+    process_big_state(list(range(100000)))
+    args_context = global_error_handler.error_history[-1].context["args"]
+    print(f"   大参数上下文长度: {len(args_context)}")
+    assert len(args_context) <= 200, "错误上下文中的参数表示应有长度上限"
+
+    @safe_execute(default_return=None)
+    def process_many_args(*args, **kwargs):
+        raise RuntimeError("多参数测试错误")
+
+    process_many_args("x" * 500, "y" * 500, {"k": "z" * 500}, *["s" * 300] * 7, option="o" * 500)
+    context = global_error_handler.error_history[-1].context
+    print(f"   多参数上下文长度: {len(context['args'])}/{len(context['kwargs'])}")
+    assert len(context["args"]) <= 200, "多个长参数的总表示长度也应有上限"
+    assert len(context["kwargs"]) <= 200, "关键字参数的表示长度应有上限"
+
     # 测试2: validate_input装饰器
     print("\n🎯 测试2: 输入验证装饰器")
     print("-" * 30)
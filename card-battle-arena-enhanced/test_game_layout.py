@@ -237,6 +237,41 @@ class TestLayoutUpdates:
             if hasattr(game_ui, 'live') and game_ui.live:
                 game_ui.live.update.assert_called()
 
+    def test_unchanged_area_skips_rebuild(self):
+        """
+        测试3.3: 输入未变化时跳过重建
+        验证相同输入不重建组件，原地修改后仍会更新
+        """
+        from game_ui import GameLayout
+
+        layout = GameLayout()
+        hand = [{"name": "火球术", "cost": 4, "attack": 0, "health": 0, "type": "spell"}]
+
+        layout.update_hand_area(hand, 5)
+        first = layout.layout["hand_area"].renderable
+
+        layout.update_hand_area(hand, 5)
+        assert layout.layout["hand_area"].renderable is first, "输入相同应复用已有组件"
+
+        hand[0]["cost"] = 3
+        layout.update_hand_area(hand, 5)
+        second = layout.layout["hand_area"].renderable
+        assert second is not first, "原地修改后应重建组件"
+
+        hand[0].setdefault("mechanics", []).append("charge")
+        layout.update_hand_area(hand, 5)
+        third = layout.layout["hand_area"].renderable
+        assert third is not second, "嵌套列表原地修改后应重建组件"
+
+        hand[0]["mechanics"].append("taunt")
+        layout.update_hand_area(hand, 5)
+        assert layout.layout["hand_area"].renderable is not third, "再次修改嵌套列表后应重建组件"
+        fourth = layout.layout["hand_area"].renderable
+
+        layout.console.width = layout.console.width + 10
+        layout.update_hand_area(hand, 5)
+        assert layout.layout["hand_area"].renderable is not fourth, "终端宽度变化后应重建组件"
+
 
 class TestLayoutInteraction:
     """测试Layout交互功能"""
@@ -165,12 +165,93 @@ async def test_command_integration():
     return True
 
 
+async def test_case_insensitive_lookup():
+    """测试命令名称和别名大小写不敏感"""
+    print("\n🧪 测试命令大小写匹配")
+    print("=" * 50)
+
+    game = CardGame("大小写测试玩家", "大小写测试AI")
+    ui = MockUI()
+    processor = UnifiedCommandProcessor()
+
+    assert all(key == key.lower() for key in processor.commands)
+
+    for command_text in ["HELP", "  Help  ", "H"]:
+        context = CommandContext(game=game, ui=ui, player_idx=0, command_text=command_text)
+        success, message, data = await processor.process_command(context)
+        print(f"   '{command_text}': {'成功' if success else '失败'} - {message}")
+        assert success and data == {"action": "show_help"}
+
+    print(f"\n🎉 命令大小写匹配测试完成！")
+    return True
+
+
+async def test_read_only_command_cache():
+    """测试帮助命令在状态未变化时复用缓存"""
+    print("\n🧪 测试只读命令缓存")
+    print("=" * 50)
+
+    game = CardGame("缓存测试玩家", "缓存测试AI")
+    ui = MockUI()
+    processor = UnifiedCommandProcessor()
+
+    calls = []
+    original_help = game.get_context_help
+
+    def counting_help():
+        calls.append(game.turn_version)
+        return original_help()
+
+    game.get_context_help = counting_help
+
+    def create_context(command_text):
+        return CommandContext(game=game, ui=ui, player_idx=0, command_text=command_text)
+
+    await processor.process_command(create_context("help"))
+    await processor.process_command(create_context("help"))
+    print(f"   状态未变化时帮助生成次数: {len(calls)}")
+    assert len(calls) == 1
+
+    # 改变游戏状态后缓存失效
+    await processor.process_command(create_context("end"))
+    await processor.process_command(create_context("help"))
+    print(f"   回合结束后帮助生成次数: {len(calls)}")
+    assert len(calls) == 2
+
+    # 状态布局按终端宽度缓存，宽度变化后重新构建
+    import os
+    import commands.game_commands as game_commands
+
+    layout_calls = []
+    original_build = game.build_status_layout
+
+    def counting_build(*args, **kwargs):
+        layout_calls.append(kwargs)
+        return original_build(*args, **kwargs)
+
+    game.build_status_layout = counting_build
+    original_size = game_commands.shutil.get_terminal_size
+    try:
+        for width in (100, 100, 140):
+            game_commands.shutil.get_terminal_size = lambda width=width: os.terminal_size((width, 40))
+            await processor.process_command(create_context("status"))
+    finally:
+        game_commands.shutil.get_terminal_size = original_size
+    print(f"   宽度变化后状态布局构建次数: {len(layout_calls)}")
+    assert len(layout_calls) == 2
+
+    print(f"\n🎉 只读命令缓存测试完成！")
+    return True
+
+
 if __name__ == "__main__":
     async def main():
         success1 = await test_unified_command_processor()
         success2 = await test_command_integration()
+        success3 = await test_read_only_command_cache()
+        success4 = await test_case_insensitive_lookup()
 
-        if success1 and success2:
+        if success1 and success2 and success3 and success4:
             print("\n🎉 所有测试通过！统一命令处理器工作正常。")
             return True
         else:
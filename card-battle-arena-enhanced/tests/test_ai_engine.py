@@ -5,11 +5,12 @@ AI引擎测试套件
 import pytest
 import asyncio
 import time
+from dataclasses import replace
 from unittest.mock import Mock, patch
 
 # 导入要测试的模块
 from ai_engine.engine import AIEngine, AIEngineConfig
-from ai_engine.strategies.rule_based import RuleBasedStrategy
+from ai_engine.strategies.rule_based import RuleBasedStrategy, SEARCH_DEPTH, SEARCH_WIDTH
 from ai_engine.strategies.base import AIAction, ActionType, GameContext
 from ai_engine.agents.agent_personality import PersonalityManager, PERSONALITY_PROFILES
 from ai_engine.agents.ai_agent import AIAgent
@@ -120,6 +121,150 @@ class TestRuleBasedStrategy:
         assert isinstance(score, float)
         assert -1 <= score <= 1
 
+    def test_evaluation_cache(self, strategy):
+        """测试同一局面的评估结果被复用"""
+        def make_context(opponent_health):
+            return GameContext(
+                game_id="test_game_002", current_player=0, turn_number=3, phase="main",
+                player_hand=[{"name": "火球术", "cost": 4, "attack": 6, "card_type": "spell"}],
+                player_field=[{"name": "狼人", "attack": 3, "health": 2, "can_attack": True}],
+                opponent_field=[],
+                player_mana=5, opponent_mana=4, player_health=20, opponent_health=opponent_health
+            )
+
+        context = make_context(opponent_health=20)
+        attacks = strategy._evaluate_attacks(context)
+        assert strategy._evaluate_attacks(make_context(opponent_health=20)) == attacks
+        assert strategy._evaluate_play_cards(context) is strategy._evaluate_play_cards(context)
+
+        # 局面变化后重新评估，可斩杀时优先打脸
+        lethal_attacks = strategy._evaluate_attacks(make_context(opponent_health=4))
+        assert lethal_attacks is not attacks
+        assert lethal_attacks[0].parameters["target"] == "opponent_hero"
+        assert lethal_attacks[0].confidence == 0.9
+        # 随从的 mechanics 为 None 时按无特殊能力处理
+        no_mechanics = [{"name": "鱼人", "attack": 1, "health": 1, "mechanics": None}]
+        assert strategy._has_lethal(replace(make_context(opponent_health=4), opponent_field=no_mechanics))
+
+    @pytest.mark.asyncio
+    async def test_evaluation_cache_reset_per_decision(self, strategy):
+        """测试每次决策开始时清空评估缓存，不复用上一局面的动作对象"""
+        strategy.config["min_thinking_time"] = 0
+        strategy.config["max_thinking_time"] = 0
+        context = GameContext(
+            game_id="test_game_003", current_player=0, turn_number=3, phase="main",
+            player_hand=[], player_field=[{"name": "狼人", "attack": 3, "health": 2, "can_attack": True}],
+            opponent_field=[], player_mana=5, opponent_mana=4, player_health=20, opponent_health=20
+        )
+        await strategy.make_decision(context)
+
+        # 置换表命中的决策也要清空上一次直接评估留下的缓存
+        stale = strategy._evaluate_attacks(context)
+        await strategy.make_decision(context)
+        assert all(actions is not stale for actions in strategy._eval_cache.values())
+
+    @pytest.mark.asyncio
+    async def test_transposition_table(self):
+        """测试相同局面的决策直接命中置换表"""
+        strategy = RuleBasedStrategy("置换表AI", {"max_thinking_time": 0, "transposition_table_size": 1})
+
+        def make_context(player_mana):
+            return GameContext(
+                game_id="test_game_003", current_player=0, turn_number=2, phase="main",
+                player_hand=[{"name": "鱼人", "cost": 1, "attack": 1, "health": 1, "card_type": "minion"}],
+                player_field=[], opponent_field=[],
+                player_mana=player_mana, opponent_mana=2, player_health=30, opponent_health=30
+            )
+
+        first = await strategy.make_decision(make_context(2))
+        assert list(strategy._tt.values()) == [("play", 0)]
+
+        # 命中置换表时按当前局面重建动作，不引用上一局面的卡牌
+        context = make_context(2)
+        hit = await strategy.make_decision(context)
+        assert hit is not first and hit.action_type == first.action_type
+        assert hit.parameters["card"] is context.player_hand[0]
+
+        # 容量为1时，新局面会淘汰旧条目
+        await strategy.make_decision(make_context(3))
+        assert list(strategy._tt) == [strategy._context_key(make_context(3))]
+
+        # 嘲讽/潜行和对手随从能否攻击都会改变搜索结果，指纹必须区分
+        context = make_context(2)
+        context.player_field = [{"name": "狼", "attack": 2, "health": 2, "can_attack": False}]
+        context.opponent_field = [{"name": "狼", "attack": 2, "health": 2, "can_attack": False}]
+        fingerprint = strategy._context_key(context)
+        context.player_field[0]["mechanics"] = ["taunt"]
+        assert strategy._context_key(context) != fingerprint
+        context.player_field[0]["mechanics"] = []
+        context.opponent_field[0]["can_attack"] = True
+        assert strategy._context_key(context) != fingerprint
+
+    def test_lookahead_search(self):
+        """测试前瞻搜索能找到置信度排序会错过的斩杀"""
+        def make_context(opponent_health):
+            return GameContext(
+                game_id="test_game_004", current_player=0, turn_number=3, phase="main",
+                player_hand=[{"name": "鱼人", "cost": 2, "attack": 3, "health": 3, "card_type": "minion"},
+                             {"name": "奥术飞弹", "cost": 1, "attack": 2, "card_type": "spell"}],
+                player_field=[],
+                opponent_field=[{"name": "狼", "attack": 2, "health": 2}],
+                player_mana=3, opponent_mana=3, player_health=20, opponent_health=opponent_health
+            )
+
+        greedy = RuleBasedStrategy("贪心AI", {"search_depth": 0})
+        assert greedy._search_best_action(make_context(2)).parameters["card"]["name"] == "鱼人"
+
+        strategy = RuleBasedStrategy("搜索AI")
+        assert strategy._search_best_action(make_context(2)).parameters["card"]["name"] == "奥术飞弹"
+
+        # 可斩杀的法术排在法力效率更高的随从之前
+        for opponent_health, first_card in ((2, 1), (20, 0)):
+            ordering_context = make_context(opponent_health)
+            ordering_context.player_hand[0]["cost"] = 1
+            assert strategy._legal_moves(ordering_context, True)[0] == ("play", first_card)
+
+        # 叶子局面数受搜索宽度和深度限制
+        strategy._search_best_action(make_context(20))
+        assert 0 < strategy._search_leaves <= SEARCH_WIDTH ** SEARCH_DEPTH
+        assert strategy._search_tt
+        assert strategy._search_completed_depth == SEARCH_DEPTH
+
+        # 时间预算耗尽时返回已完成的较浅一轮迭代的结果
+        hurried = RuleBasedStrategy("限时AI", {"search_time_budget": 0})
+        assert hurried._search_best_action(make_context(2)).parameters["card"]["name"] == "奥术飞弹"
+        assert hurried._search_completed_depth == 1
+
+        # 出牌顺序不同到达的同一局面共用置换表条目
+        reordered = make_context(20)
+        reordered.player_hand.reverse()
+        assert strategy._search_key(reordered, True) == strategy._search_key(make_context(20), True)
+
+    @pytest.mark.asyncio
+    async def test_heal_spell_search(self):
+        """测试搜索把负攻击力的法术当作治疗自己，残血时仍会使用治疗法术"""
+        strategy = RuleBasedStrategy("治疗AI", {"min_thinking_time": 0, "max_thinking_time": 0})
+        heal = {"name": "治愈术", "cost": 2, "attack": -5, "health": 0, "card_type": "spell"}
+        context = GameContext(
+            game_id="test_game_005", current_player=0, turn_number=5, phase="main",
+            player_hand=[heal], player_field=[],
+            opponent_field=[{"name": "狼", "attack": 3, "health": 2, "can_attack": True}],
+            player_mana=2, opponent_mana=2, player_health=5, opponent_health=20
+        )
+
+        action = await strategy.make_decision(context)
+        assert action.action_type == ActionType.PLAY_CARD
+        assert action.parameters["card"] is heal
+
+        healed, _ = strategy._apply_move(context, ("play", 0), True)
+        assert (healed.player_health, healed.opponent_health) == (10, 20)
+        # 治疗不超过生命上限，攻击力为0的功能性法术不影响生命值
+        context.player_health = 28
+        assert strategy._apply_move(context, ("play", 0), True)[0].player_health == 30
+        context.player_hand = [dict(heal, name="治疗之环", attack=0)]
+        assert strategy._apply_move(context, ("play", 0), True)[0] == replace(
+            context, player_hand=[], player_mana=0)
+
     def test_performance_stats(self, strategy):
         """测试性能统计"""
         stats = strategy.get_performance_stats()